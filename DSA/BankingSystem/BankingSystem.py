@@ -1,9 +1,150 @@
+import argparse
+import csv
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:     # Batch replay falls back to plain Python
+    np = None
+
+# Fenwick (binary indexed) tree over a list of counts
+class FenwickTree:
+    def __init__(self, values=()):
+        self.tree = [0] + list(values)
+        # Build in O(n) by pushing each partial sum to its parent
+        for i in range(1, len(self.tree)):
+            parent = i + (i & -i)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[i]
+
+    # Add delta to the value at position i (0-based)
+    def add(self, i, delta):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    # Sum of the first i values
+    def prefix(self, i):
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    # Find the position holding the k-th unit (0-based); returns (position, offset in it)
+    def find(self, k):
+        pos = 0
+        step = 1 << (len(self.tree).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos, k
+
+# Sorted multiset of account balances for threshold and max-balance queries.
+# Balances are kept in sorted buckets of bounded size, with a Fenwick tree over
+# the bucket sizes, so counts and updates cost O(log n) (plus a bounded bucket shift).
+class BalanceIndex:
+    BUCKET_SIZE = 512
+
+    def __init__(self):
+        self.buckets = []           # Sorted lists of balances
+        self.maxes = []             # Largest balance in each bucket
+        self.sizes = FenwickTree()  # Bucket sizes
+        self.count = 0              # Number of balances stored
+        self.holders = {}           # Balance -> nodes with that balance
+
+    def _rebuild_sizes(self):
+        self.sizes = FenwickTree(len(bucket) for bucket in self.buckets)
+
+    # Method to insert a balance value
+    def _insert(self, value):
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxes.append(value)
+            self._rebuild_sizes()
+        else:
+            i = min(bisect_left(self.maxes, value), len(self.buckets) - 1)
+            bucket = self.buckets[i]
+            insort(bucket, value)
+            self.maxes[i] = bucket[-1]
+            if len(bucket) > 2 * self.BUCKET_SIZE:
+                # Split an oversized bucket in half
+                self.buckets.insert(i + 1, bucket[self.BUCKET_SIZE:])
+                del bucket[self.BUCKET_SIZE:]
+                self.maxes.insert(i, bucket[-1])
+                self._rebuild_sizes()
+            else:
+                self.sizes.add(i, 1)
+        self.count += 1
+
+    # Method to remove a balance value
+    def _remove(self, value):
+        i = bisect_left(self.maxes, value)
+        bucket = self.buckets[i]
+        del bucket[bisect_left(bucket, value)]
+        if bucket:
+            self.maxes[i] = bucket[-1]
+            self.sizes.add(i, -1)
+        else:
+            del self.buckets[i]
+            del self.maxes[i]
+            self._rebuild_sizes()
+        self.count -= 1
+
+    # Method to register a node with its current balance
+    def add(self, node):
+        self._insert(node.balance)
+        self.holders.setdefault(node.balance, {})[node] = None
+
+    # Method to move a node from its old balance to its current balance
+    def update(self, node, old_balance):
+        if old_balance == node.balance:
+            return
+        self._remove(old_balance)
+        nodes = self.holders[old_balance]
+        del nodes[node]
+        if not nodes:
+            del self.holders[old_balance]
+        self.add(node)
+
+    # Method to count balances >= x
+    def count_at_least(self, x):
+        i = bisect_left(self.maxes, x)
+        if i == len(self.buckets):
+            return 0
+        bucket = self.buckets[i]
+        in_bucket = len(bucket) - bisect_left(bucket, x)
+        return in_bucket + self.count - self.sizes.prefix(i + 1)
+
+    # Method to get the maximum balance (None when empty)
+    def max_balance(self):
+        return self.maxes[-1] if self.maxes else None
+
+    # Method to get the nodes holding the maximum balance
+    def max_holders(self):
+        if not self.maxes:
+            return []
+        return list(self.holders[self.maxes[-1]])
+
 # Node class for singly linked list of accounts
 class Node:
+    __slots__ = ('acc_no', 'balance', 'next', 'position')     # No per-node __dict__
+
     def __init__(self, acc):
         self.acc_no = acc           # Account number
         self.balance = 1000         # Initial balance set to 1000
         self.next = None            # Pointer to next node in the list
+        self.position = 0           # Position in the list, for ordering query results
 
 # Singly Linked List class for managing accounts
 class SLL:
@@ -11,63 +152,59 @@ class SLL:
         self.first = None           # Pointer to the first node
         self.last = None            # Pointer to the last node
         self.length = 0             # Length of the linked list
+        self.index = {}             # Account number -> node, for O(1) lookups
+        self.balances = BalanceIndex()  # Sorted balances for threshold/max queries
 
     # Method to add a new account node
     def push_node(self, acc):
         new_node = Node(acc)
+        new_node.position = self.length
         if self.length == 0:
             self.first = self.last = new_node
         else:
             self.last.next = new_node
             self.last = new_node
         self.length += 1
+        # Keep the first node for a repeated account number, as a list scan would
+        self.index.setdefault(acc, new_node)
+        self.balances.add(new_node)
 
     # Method to find a node by account number
     def find_node(self, acc):
-        temp = self.first
-        while temp is not None:
-            if temp.acc_no == acc:
-                return temp
-            temp = temp.next
-        return None
+        return self.index.get(acc)
+
+    # Method to change a node's balance, keeping the balance index in sync
+    def adjust_balance(self, node, delta):
+        old_balance = node.balance
+        node.balance += delta
+        self.balances.update(node, old_balance)
 
     # Method to perform deposit or withdrawal transaction
     def transaction(self, acc, mode, val):
         process_node = self.find_node(acc)
         if process_node is not None:
             if mode == 'D':
-                process_node.balance += val    # Deposit
+                self.adjust_balance(process_node, val)     # Deposit
             elif mode == 'W':
-                process_node.balance -= val    # Withdrawal
+                self.adjust_balance(process_node, -val)    # Withdrawal
+
+    # Method to apply signed per-account balance deltas in one batch
+    def apply_deltas(self, deltas):
+        for acc, delta in deltas.items():
+            process_node = self.find_node(acc)
+            if process_node is not None and delta:
+                self.adjust_balance(process_node, delta)
 
     # Method to print number of accounts with balance >= x
     def print_bal_more_x(self, x):
-        count = 0
-        temp = self.first
-        while temp is not None:
-            if temp.balance >= x:
-                count += 1
-            temp = temp.next
+        count = self.balances.count_at_least(x)
         print(f"Number of accounts with balance >= {x}: {count}")
 
     # Method to print account number(s) with maximum balance
     def print_max_balance(self):
-        max_balance = -1
-        temp = self.first
-
-        # Find maximum balance
-        while temp is not None:
-            if temp.balance > max_balance:
-                max_balance = temp.balance
-            temp = temp.next
-
-        # Print account number(s) with maximum balance
-        temp = self.first
-        result = []
-        while temp is not None:
-            if temp.balance == max_balance:
-                result.append(str(temp.acc_no))
-            temp = temp.next
+        # Report holders in list order, as a list scan would
+        holders = sorted(self.balances.max_holders(), key=lambda node: node.position)
+        result = [str(node.acc_no) for node in holders]
         print("Account(s) with max balance: "," ".join(result))
 
     # Method to print balance of account with given account number
@@ -76,31 +213,146 @@ class SLL:
         if temp is not None:
             print(temp.balance)
             
-    def transfer_amount(self, from_acc, to_acc, amount, dll):
+    # Method to transfer amount between two accounts, recording both legs in dll
+    def transfer_amount(self, from_acc, to_acc, amount, dll, verbose=True):
         from_node = self.find_node(from_acc)
         to_node = self.find_node(to_acc)
         if from_node is None or to_node is None:
-            print("One or Both account numbers are invalid")
+            if verbose:
+                print("One or Both account numbers are invalid")
+            return
         if from_node.balance < amount:
-            print("Amount is greater than Account Balance, Insufficient Funds")
+            if verbose:
+                print("Amount is greater than Account Balance, Insufficient Funds")
             return
-        from_node.balance -= amount
-        to_node.balance += amount
+        self.adjust_balance(from_node, -amount)
+        self.adjust_balance(to_node, amount)
         dll.push_d_node(from_acc, 'W', amount)
         dll.push_d_node(to_acc,'D', amount)
-        print(f'{amount} has been transferred from account {from_acc} to account {to_acc}')
+        if verbose:
+            print(f'{amount} has been transferred from account {from_acc} to account {to_acc}')
+
+# Signed balance change of a transaction (unknown actions change nothing)
+def signed_amount(action, amount):
+    if action == 'D':
+        return amount
+    if action == 'W':
+        return -amount
+    return 0
 
 # Node class for doubly linked list of transactions
 class DNode:
+    __slots__ = ('acc', 'action', 'amount', 'next', 'prev', 'chunk')  # No per-node __dict__
+
     def __init__(self, acc=-1, action='A', val=-1):
         self.acc = acc              # Account number
         self.action = action        # Transaction type (Deposit 'D' or Withdrawal 'W')
         self.amount = val           # Amount of transaction
         self.next = None            # Pointer to next node
         self.prev = None            # Pointer to previous node
+        self.chunk = None           # Chunk of the positional index holding this node
+
+# Block of consecutive transaction nodes in the positional index
+class LogChunk:
+    __slots__ = ('nodes', 'pos')
+
+    def __init__(self, nodes, pos):
+        self.nodes = nodes          # Transaction nodes, in list order
+        self.pos = pos              # Position of this chunk in the index
+
+# Positional index over the transaction list: nodes are kept in chunks of
+# bounded size with a Fenwick tree over the chunk sizes, so finding the k-th
+# transaction, inserting at a position and removing a node cost O(log n)
+# (plus a bounded shift inside one chunk).
+class TransactionIndex:
+    CHUNK_SIZE = 512
+
+    def __init__(self):
+        self.chunks = []            # LogChunk objects, in list order
+        self.sizes = FenwickTree()  # Chunk sizes
+        self.count = 0              # Number of indexed nodes
+
+    # Method to renumber chunks and rebuild the size tree after a split/merge
+    def _rebuild(self):
+        for pos, chunk in enumerate(self.chunks):
+            chunk.pos = pos
+        self.sizes = FenwickTree(len(chunk.nodes) for chunk in self.chunks)
+
+    # Method to get the node at position k (1-based)
+    def node_at(self, k):
+        chunk_pos, offset = self.sizes.find(k - 1)
+        return self.chunks[chunk_pos].nodes[offset]
+
+    # Method to get the position (1-based) of an indexed node
+    def index_of(self, node):
+        chunk = node.chunk
+        return self.sizes.prefix(chunk.pos) + chunk.nodes.index(node) + 1
+
+    # Method to insert a node so that it becomes position k (1-based)
+    def insert(self, k, node):
+        if not self.chunks:
+            chunk = LogChunk([node], 0)
+            self.chunks.append(chunk)
+            node.chunk = chunk
+            self.count += 1
+            self._rebuild()
+            return
+
+        if k > self.count:
+            chunk = self.chunks[-1]
+            chunk.nodes.append(node)
+        else:
+            chunk_pos, offset = self.sizes.find(k - 1)
+            chunk = self.chunks[chunk_pos]
+            chunk.nodes.insert(offset, node)
+        node.chunk = chunk
+        self.count += 1
+
+        if len(chunk.nodes) > 2 * self.CHUNK_SIZE:
+            # Split an oversized chunk in half
+            moved = LogChunk(chunk.nodes[self.CHUNK_SIZE:], chunk.pos + 1)
+            del chunk.nodes[self.CHUNK_SIZE:]
+            for moved_node in moved.nodes:
+                moved_node.chunk = moved
+            self.chunks.insert(moved.pos, moved)
+            self._rebuild()
+        else:
+            self.sizes.add(chunk.pos, 1)
+
+    # Method to append a node at the end
+    def append(self, node):
+        self.insert(self.count + 1, node)
+
+    # Method to remove an indexed node
+    def remove(self, node):
+        chunk = node.chunk
+        chunk.nodes.remove(node)
+        node.chunk = None
+        self.count -= 1
+        if chunk.nodes:
+            self.sizes.add(chunk.pos, -1)
+        else:
+            del self.chunks[chunk.pos]
+            self._rebuild()
+
+# Net per-account balance change of one checkpoint segment, as two parallel
+# int64 arrays (account numbers and deltas)
+class SegmentDeltas:
+    __slots__ = ('accs', 'deltas')
+
+    def __init__(self, deltas):
+        self.accs = array('q', deltas.keys())
+        self.deltas = array('q', deltas.values())
+
+    # Method to add (sign=1) or subtract (sign=-1) this segment into a deltas dict
+    def merge_into(self, deltas, sign):
+        for acc, delta in zip(self.accs, self.deltas):
+            deltas[acc] = deltas.get(acc, 0) + sign * delta
 
 # Doubly Linked List class for managing transactions
 class DLL:
+    CHECKPOINT_EVERY = 4096     # Transactions per checkpoint segment
+
     def __init__(self):
         self.head = DNode()         # Head sentinel node
         self.tail = DNode()         # Tail sentinel node
@@ -109,6 +361,15 @@ class DLL:
         self.cursor = self.head     # Pointer to current node
         self.d_len = 0              # Length of the doubly linked list
         self.cursor_idx = 0         # Index of current node
+        self.log = TransactionIndex()   # Positional index over the nodes
+        self.by_account = {}        # Account number -> its nodes, in list order
+        # checkpoints[i] holds the net deltas of positions i*K+1 .. (i+1)*K
+        # (K = CHECKPOINT_EVERY); it is filled in as cursor moves walk segments
+        self.checkpoints = []
+
+    # Method to get the node at position k (0 is the head sentinel)
+    def node_at(self, k):
+        return self.head if k == 0 else self.log.node_at(k)
 
     # Method to add a new transaction node
     def push_d_node(self, a, b, c):
@@ -118,53 +379,118 @@ class DLL:
         new_node.next = self.tail
         self.tail.prev = new_node
         self.d_len += 1
+        self.log.append(new_node)
+        self.by_account.setdefault(a, []).append(new_node)
+
+    # Method to move the cursor to position idx on account list l1. The
+    # transactions in between are applied (or reverted) as one batch of
+    # per-account balance deltas. Whole segments with a checkpoint are taken
+    # from the checkpoint instead of walking their nodes; segments walked end
+    # to end get their checkpoint recorded on the way.
+    def seek(self, idx, l1):
+        idx = max(0, min(idx, self.d_len))
+        every = self.CHECKPOINT_EVERY
+        checkpoints = self.checkpoints
+        deltas = {}
+        pos = self.cursor_idx
+        temp = self.cursor          # Node at pos, or None after a checkpoint jump
+
+        while pos < idx:
+            seg = pos // every
+            if pos % every == 0 and pos + every <= idx and seg < len(checkpoints):
+                checkpoints[seg].merge_into(deltas, 1)
+                pos += every
+                temp = None
+                continue
+            if temp is None:
+                temp = self.node_at(pos)
+            end = min(idx, (seg + 1) * every)
+            record = pos % every == 0 and end == (seg + 1) * every and seg == len(checkpoints)
+            seg_deltas = {}
+            while pos < end:
+                temp = temp.next
+                pos += 1
+                seg_deltas[temp.acc] = seg_deltas.get(temp.acc, 0) + signed_amount(temp.action, temp.amount)
+            if record:
+                checkpoints.append(SegmentDeltas(seg_deltas))
+            for acc, delta in seg_deltas.items():
+                deltas[acc] = deltas.get(acc, 0) + delta
+
+        while pos > idx:
+            seg = (pos - 1) // every
+            if pos % every == 0 and pos - every >= idx and seg < len(checkpoints):
+                checkpoints[seg].merge_into(deltas, -1)
+                pos -= every
+                temp = None
+                continue
+            if temp is None:
+                temp = self.node_at(pos)
+            end = max(idx, seg * every)
+            record = pos == (seg + 1) * every and end == seg * every and seg == len(checkpoints)
+            seg_deltas = {}
+            while pos > end:
+                seg_deltas[temp.acc] = seg_deltas.get(temp.acc, 0) + signed_amount(temp.action, temp.amount)
+                temp = temp.prev
+                pos -= 1
+            if record:
+                checkpoints.append(SegmentDeltas(seg_deltas))
+            for acc, delta in seg_deltas.items():
+                deltas[acc] = deltas.get(acc, 0) - delta
+
+        self.cursor = temp if temp is not None else self.node_at(idx)
+        self.cursor_idx = idx
+        l1.apply_deltas(deltas)
+
+    # Method to drop checkpoints of segments that include position k or later
+    def invalidate_checkpoints(self, k):
+        del self.checkpoints[(k - 1) // self.CHECKPOINT_EVERY:]
 
     # Method to process next x transactions on account list l1
     def process_x(self, x, l1):
-        while self.cursor.next != self.tail and x > 0:
-            self.cursor = self.cursor.next
-            self.cursor_idx += 1
-            l1.transaction(self.cursor.acc, self.cursor.action, self.cursor.amount)
-            x -= 1
+        if x > 0:
+            self.seek(self.cursor_idx + x, l1)
 
     # Method to undo last y transactions on account list l1
     def undo_y(self, y, l1):
-        while self.cursor != self.head and y > 0:
-            l1.transaction(self.cursor.acc, self.cursor.action, -(self.cursor.amount))
-            self.cursor = self.cursor.prev
-            self.cursor_idx -= 1
-            y -= 1
+        if y > 0:
+            self.seek(self.cursor_idx - y, l1)
 
-    # Method to insert a new transaction node at position k
+    # Method to insert a new transaction node after position k
     def insert_node_k(self, a, b, c, k, l1):
         if 1 <= k <= self.d_len:
             add_node = DNode(a, b, c)
-            temp = self.head
-            for i in range(k):
-                temp = temp.next
+            temp = self.log.node_at(k)
             temp.next.prev = add_node
             add_node.next = temp.next
             temp.next = add_node
             add_node.prev = temp
-            if temp != self.cursor:
-                l1.transaction(a, b, c)
+            self.log.insert(k + 1, add_node)
             self.d_len += 1
+            self.invalidate_checkpoints(k + 1)
+            account_nodes = self.by_account.setdefault(a, [])
+            account_nodes.insert(bisect_left(account_nodes, k + 1, key=self.log.index_of), add_node)
+            # A transaction inserted before the cursor counts as already processed
+            if k < self.cursor_idx:
+                l1.transaction(a, b, c)
+                self.cursor_idx += 1
 
     # Method to delete m transactions for account acc on account list l1
     def delete_am(self, acc, m, l1):
-        temp = self.cursor.next
-        while temp != self.tail and m != 0:
-            if temp.acc == acc:
-                del_node = temp
-                temp.prev.next = temp.next
-                temp.next.prev = temp.prev
-                temp = temp.next
-                del del_node
-                self.d_len -= 1
-                m -= 1
-            else:
-                temp = temp.next
-        self.cursor.next = temp
+        account_nodes = self.by_account.get(acc)
+        if not account_nodes or m <= 0:
+            return
+        # Only pending transactions (after the cursor) can be deleted
+        first = bisect_right(account_nodes, self.cursor_idx, key=self.log.index_of)
+        if first < len(account_nodes):
+            self.invalidate_checkpoints(self.log.index_of(account_nodes[first]))
+        for del_node in account_nodes[first:first + m]:
+            del_node.prev.next = del_node.next
+            del_node.next.prev = del_node.prev
+            self.log.remove(del_node)
+            self.d_len -= 1
+        del account_nodes[first:first + m]
+        if not account_nodes:
+            del self.by_account[acc]
 
     # Method to process all transactions on account list l1
     def process_all(self, l1):
@@ -172,35 +498,490 @@ class DLL:
 
     # Method to print all transactions for account acc
     def print_all_of_y(self, acc):
-        temp = self.head.next
-        while temp != self.tail:
-            if temp.acc == acc:
-                print(f"{temp.acc} {temp.action} {temp.amount}")
-            temp = temp.next
+        for temp in self.by_account.get(acc, ()):
+            print(f"{temp.acc} {temp.action} {temp.amount}")
+
+# BATCH REPLAY MODE
+# Loads accounts and transactions from files and applies every transaction
+# (process_all semantics) in batches, without building the linked lists.
+# File formats, picked by extension:
+#   accounts      .csv: one account number per line
+#                 .bin: little-endian int64 account numbers
+#   transactions  .csv: "account,D|W,amount" per line
+#                 .bin: packed little-endian records (int64 acc, 1-byte action, int64 amount)
+# A header line in a CSV file is skipped.
+
+INITIAL_BALANCE = 1000
+TRANSACTION_RECORD = struct.Struct('<qcq')
+
+# Function to read account numbers from a file, in file order
+def read_accounts(path):
+    if path.endswith('.bin'):
+        with open(path, 'rb') as accounts_file:
+            data = accounts_file.read()
+        if np is not None:
+            return np.frombuffer(data, dtype='<i8').copy()
+        return list(array('q', data))
+
+    accounts = []
+    with open(path, newline='') as accounts_file:
+        for row in csv.reader(accounts_file):
+            if row and row[0].strip().lstrip('-').isdigit():
+                accounts.append(int(row[0]))
+    return np.array(accounts, dtype=np.int64) if np is not None else accounts
+
+# Function to stream transactions as (accounts, signed amounts) batches
+def iter_transaction_batches(path, batch_size):
+    if path.endswith('.bin'):
+        with open(path, 'rb') as transactions_file:
+            while True:
+                data = transactions_file.read(batch_size * TRANSACTION_RECORD.size)
+                if not data:
+                    break
+                if np is not None:
+                    records = np.frombuffer(data, dtype=[('acc', '<i8'), ('action', 'S1'), ('amount', '<i8')])
+                    signs = (records['action'] == b'D').astype(np.int64) - (records['action'] == b'W')
+                    yield records['acc'], records['amount'] * signs
+                else:
+                    accs, signed = [], []
+                    for acc, action, amount in TRANSACTION_RECORD.iter_unpack(data):
+                        accs.append(acc)
+                        signed.append(signed_amount(action.decode(), amount))
+                    yield accs, signed
+        return
+
+    with open(path, newline='') as transactions_file:
+        accs, signed = [], []
+        for row in csv.reader(transactions_file):
+            if len(row) < 3 or not row[0].strip().lstrip('-').isdigit():
+                continue
+            accs.append(int(row[0]))
+            signed.append(signed_amount(row[1].strip(), int(row[2])))
+            if len(accs) == batch_size:
+                yield accs, signed
+                accs, signed = [], []
+        if accs:
+            yield accs, signed
+
+# Function to replay transaction files against account files and write a balance snapshot
+def replay_files(accounts_path, transactions_path, snapshot_path, batch_size=1_000_000):
+    start = time.perf_counter()
+    accounts = read_accounts(accounts_path)
+    balances = [INITIAL_BALANCE] * len(accounts)
+    applied = 0
+
+    if np is not None:
+        balances = np.full(len(accounts), INITIAL_BALANCE, dtype=np.int64)
+        # Like SLL.find_node, a repeated account number maps to its first row
+        unique_accounts, first_rows = np.unique(accounts, return_index=True)
+        for accs, signed in iter_transaction_batches(transactions_path, batch_size):
+            accs = np.asarray(accs, dtype=np.int64)
+            signed = np.asarray(signed, dtype=np.int64)
+            slots = np.searchsorted(unique_accounts, accs)
+            slots[slots == len(unique_accounts)] = 0
+            known = unique_accounts[slots] == accs if len(unique_accounts) else np.zeros(len(accs), dtype=bool)
+            np.add.at(balances, first_rows[slots[known]], signed[known])
+            applied += len(accs)
+    else:
+        rows = {}
+        for row, acc in enumerate(accounts):
+            rows.setdefault(acc, row)
+        for accs, signed in iter_transaction_batches(transactions_path, batch_size):
+            for acc, amount in zip(accs, signed):
+                row = rows.get(acc)
+                if row is not None:
+                    balances[row] += amount
+            applied += len(accs)
+
+    with open(snapshot_path, 'w', newline='') as snapshot_file:
+        writer = csv.writer(snapshot_file)
+        writer.writerow(['acc_no', 'balance'])
+        writer.writerows(zip(map(int, accounts), map(int, balances)))
+
+    elapsed = time.perf_counter() - start
+    rate = applied / elapsed if elapsed > 0 else float('inf')
+    print(f"Replayed {applied} transaction(s) over {len(accounts)} account(s) in {elapsed:.2f}s "
+          f"({rate:,.0f} transactions/s)")
+    print(f"Balance snapshot written to {snapshot_path}")
+    return accounts, balances
+
+# WRITE-AHEAD LOG AND SNAPSHOTS
+# Every state-changing operation is appended to a text log before it is applied,
+# one record per line: "<seq> <op> <args...>", with the same letters as the
+# commands (A = add account, P = push transaction, plus I, D, F, R, C, T).
+# The log is fsynced every sync_every records, so a crash can lose at most the
+# last unsynced batch. Periodically the whole state is written to a compact
+# binary snapshot and the log is truncated; recovery loads the snapshot and
+# replays only the log records newer than it.
+
+SNAPSHOT_MAGIC = b'BKSNAP01'
+SNAPSHOT_HEADER = struct.Struct('<qqqq')    # seq, accounts, transactions, cursor_idx
+
+# Append-only operation log with batched fsync
+class WriteAheadLog:
+    def __init__(self, path, sync_every=64):
+        self.path = path
+        self.sync_every = sync_every    # Records per fsync
+        self.pending = 0                # Records written since the last fsync
+        self.file = open(path, 'a', encoding='utf-8')
+
+    # Method to append one record
+    def append(self, seq, *fields):
+        self.file.write(" ".join(map(str, (seq,) + fields)) + "\n")
+        self.pending += 1
+        if self.pending >= self.sync_every:
+            self.sync()
+
+    # Method to flush and fsync pending records
+    def sync(self):
+        if self.pending:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending = 0
+
+    # Method to drop all records (after they are covered by a snapshot)
+    def truncate(self):
+        self.sync()
+        self.file.truncate(0)
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.sync()
+        self.file.close()
+
+# Function to read (seq, op, args, end) records from a log file, where end is
+# the byte offset just past the record
+def read_wal(path):
+    if not os.path.exists(path):
+        return
+    end = 0
+    with open(path, 'rb') as wal_file:
+        for line in wal_file:
+            fields = line.decode('utf-8', 'replace').split()
+            # A torn last line (crash mid-write) is incomplete and skipped
+            if not line.endswith(b"\n") or len(fields) < 2:
+                break
+            end += len(line)
+            yield int(fields[0]), fields[1], fields[2:], end
+
+# Function to write a binary snapshot of accounts, transactions and cursor
+def write_snapshot(path, seq, accounts, transactions):
+    acc_nos, balances = array('q'), array('q')
+    temp = accounts.first
+    while temp is not None:
+        acc_nos.append(temp.acc_no)
+        balances.append(temp.balance)
+        temp = temp.next
+
+    tx_accs, tx_amounts, tx_actions = array('q'), array('q'), bytearray()
+    temp = transactions.head.next
+    while temp != transactions.tail:
+        tx_accs.append(temp.acc)
+        tx_amounts.append(temp.amount)
+        tx_actions += temp.action.encode()
+        temp = temp.next
+
+    # Write to a temporary file and rename, so a crash never leaves half a snapshot
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as snapshot_file:
+        snapshot_file.write(SNAPSHOT_MAGIC)
+        snapshot_file.write(SNAPSHOT_HEADER.pack(seq, len(acc_nos), len(tx_accs), transactions.cursor_idx))
+        for column in (acc_nos, balances, tx_accs, tx_amounts):
+            snapshot_file.write(column.tobytes())
+        snapshot_file.write(tx_actions)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(tmp_path, path)
+
+# Function to load a snapshot into empty account/transaction lists; returns its seq
+def load_snapshot(path, accounts, transactions):
+    with open(path, 'rb') as snapshot_file:
+        if snapshot_file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"'{path}' is not a ledger snapshot")
+        seq, num_accounts, num_transactions, cursor_idx = SNAPSHOT_HEADER.unpack(
+            snapshot_file.read(SNAPSHOT_HEADER.size))
+        columns = []
+        for length in (num_accounts, num_accounts, num_transactions, num_transactions):
+            column = array('q')
+            column.frombytes(snapshot_file.read(length * column.itemsize))
+            columns.append(column)
+        tx_actions = snapshot_file.read(num_transactions).decode()
+
+    acc_nos, balances, tx_accs, tx_amounts = columns
+    for acc, balance in zip(acc_nos, balances):
+        accounts.push_node(acc)
+        accounts.adjust_balance(accounts.last, balance - accounts.last.balance)
+    for acc, action, amount in zip(tx_accs, tx_actions, tx_amounts):
+        transactions.push_d_node(acc, action, amount)
+    # Balances already include everything up to the cursor, so move it without replaying
+    transactions.cursor = transactions.node_at(cursor_idx)
+    transactions.cursor_idx = cursor_idx
+    return seq
+
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1     # Range of the snapshot's integer columns
+
+# Function to check ledger operation arguments; raises ValueError if one is invalid
+def check_args(op, args):
+    for position, arg in enumerate(args):
+        if op in ('P', 'I') and position == 1:
+            # The snapshot stores the action as a single byte
+            if arg not in ('D', 'W'):
+                raise ValueError(f"action must be D or W, not {arg!r}")
+        elif not isinstance(arg, int) or not INT64_MIN <= arg <= INT64_MAX:
+            raise ValueError(f"{arg!r} is not a 64-bit integer")
+
+# Accounts and transactions with optional durability. Without a data
+# directory it is a thin wrapper over SLL/DLL; with one, every mutation is
+# logged ahead of being applied and state is recovered on construction.
+class Ledger:
+    def __init__(self, data_dir=None, sync_every=64, snapshot_every=100_000):
+        self.accounts = SLL()
+        self.transactions = DLL()
+        self.seq = 0                        # Sequence number of the last logged record
+        self.snapshot_every = snapshot_every
+        self.since_snapshot = 0             # Records logged since the last snapshot
+        self.wal = None
+        if data_dir is None:
+            return
+
+        os.makedirs(data_dir, exist_ok=True)
+        self.snapshot_path = os.path.join(data_dir, 'ledger.snap')
+        wal_path = os.path.join(data_dir, 'ledger.wal')
+
+        # Recovery: load the snapshot, then replay the newer log records
+        if os.path.exists(self.snapshot_path):
+            self.seq = load_snapshot(self.snapshot_path, self.accounts, self.transactions)
+        end = 0     # Byte offset just past the last complete log record
+        for seq, op, args, end in read_wal(wal_path):
+            if seq > self.seq:
+                self._apply(op, args, verbose=False)
+                self.seq = seq
+                self.since_snapshot += 1
+        # Cut off a torn last record, so the next append starts on a fresh line
+        if os.path.exists(wal_path) and os.path.getsize(wal_path) > end:
+            os.truncate(wal_path, end)
+        self.wal = WriteAheadLog(wal_path, sync_every)
+
+    # Method to apply one operation to the in-memory state
+    def _apply(self, op, args, verbose=True):
+        if op == 'A':
+            self.accounts.push_node(int(args[0]))
+        elif op == 'P':
+            self.transactions.push_d_node(int(args[0]), args[1], int(args[2]))
+        elif op == 'I':
+            self.transactions.insert_node_k(int(args[0]), args[1], int(args[2]), int(args[3]), self.accounts)
+        elif op == 'D':
+            self.transactions.delete_am(int(args[0]), int(args[1]), self.accounts)
+        elif op == 'F':
+            self.transactions.process_x(int(args[0]), self.accounts)
+        elif op == 'R':
+            self.transactions.undo_y(int(args[0]), self.accounts)
+        elif op == 'C':
+            self.transactions.process_all(self.accounts)
+        elif op == 'T':
+            self.accounts.transfer_amount(int(args[0]), int(args[1]), int(args[2]), self.transactions, verbose)
+
+    # Method to log an operation ahead of applying it
+    def _execute(self, op, *args):
+        # Reject bad arguments before they reach the log: a logged record is
+        # replayed on every restart, so it must always apply and snapshot cleanly
+        check_args(op, args)
+        if self.wal is not None:
+            self.seq += 1
+            self.wal.append(self.seq, op, *args)
+            self.since_snapshot += 1
+        self._apply(op, [str(arg) for arg in args])
+        if self.wal is not None and self.since_snapshot >= self.snapshot_every:
+            self.checkpoint()
+
+    def push_node(self, acc):
+        self._execute('A', acc)
+
+    def push_d_node(self, a, b, c):
+        self._execute('P', a, b, c)
+
+    def insert_node_k(self, a, b, c, k):
+        self._execute('I', a, b, c, k)
+
+    def delete_am(self, acc, m):
+        self._execute('D', acc, m)
+
+    def process_x(self, x):
+        self._execute('F', x)
+
+    def undo_y(self, y):
+        self._execute('R', y)
+
+    def process_all(self):
+        self._execute('C')
+
+    def transfer_amount(self, from_acc, to_acc, amount):
+        self._execute('T', from_acc, to_acc, amount)
+
+    # Method to write a snapshot and truncate the log it covers
+    def checkpoint(self):
+        if self.wal is None:
+            return
+        self.wal.sync()
+        write_snapshot(self.snapshot_path, self.seq, self.accounts, self.transactions)
+        self.wal.truncate()
+        self.since_snapshot = 0
+
+    def close(self):
+        if self.wal is not None:
+            self.checkpoint()
+            self.wal.close()
+            self.wal = None
+
+# CONCURRENT TRANSFERS
+# Accounts are sharded: an account number hashes onto one of a fixed number
+# of shards, and each shard owns its accounts (with their balance index) and
+# the transaction log of those accounts, guarded by its own lock. A transfer
+# takes the locks of the two shards involved in ascending shard order, so two
+# transfers can never wait on each other in a cycle, and transfers between
+# other shards do not wait at all. Queries over all accounts (G, M) merge the
+# per-shard indexes; an account's transactions (S) all live in its shard.
+
+# One shard: its accounts, their transactions and the lock guarding both
+class LedgerShard:
+    def __init__(self, number):
+        self.number = number            # Position among the shards, the lock order
+        self.accounts = SLL()
+        self.transactions = DLL()
+        self.lock = threading.Lock()
+
+# Thread-safe transfers over sharded accounts and transaction logs
+class ConcurrentLedger:
+    def __init__(self, acc_nos, shards=256):
+        self.shards = [LedgerShard(number) for number in range(shards)]
+        for position, acc in enumerate(acc_nos):
+            accounts = self.shard_of(acc).accounts
+            accounts.push_node(acc)
+            accounts.last.position = position     # Order across all shards, for M
+        self.length = sum(shard.accounts.length for shard in self.shards)
+
+    # Method to get the shard owning an account number
+    def shard_of(self, acc):
+        return self.shards[hash(acc) % len(self.shards)]
+
+    # Context manager holding the locks of the given shards
+    @contextmanager
+    def hold(self, *shards):
+        shards = sorted(set(shards), key=lambda shard: shard.number)
+        for shard in shards:
+            shard.lock.acquire()
+        try:
+            yield
+        finally:
+            for shard in reversed(shards):
+                shard.lock.release()
+
+    # Method to find a node by account number
+    def find_node(self, acc):
+        return self.shard_of(acc).accounts.find_node(acc)
+
+    # Method to transfer amount between accounts; returns True if it went through
+    def transfer_amount(self, from_acc, to_acc, amount):
+        from_shard, to_shard = self.shard_of(from_acc), self.shard_of(to_acc)
+        from_node = from_shard.accounts.find_node(from_acc)
+        to_node = to_shard.accounts.find_node(to_acc)
+        if from_node is None or to_node is None:
+            return False
+        with self.hold(from_shard, to_shard):
+            # The balance check and the debit happen under the same lock
+            if from_node.balance < amount:
+                return False
+            from_shard.accounts.adjust_balance(from_node, -amount)
+            to_shard.accounts.adjust_balance(to_node, amount)
+            from_shard.transactions.push_d_node(from_acc, 'W', amount)
+            to_shard.transactions.push_d_node(to_acc, 'D', amount)
+        return True
+
+    # Method to iterate over all account nodes, shard by shard
+    def nodes(self):
+        for shard in self.shards:
+            temp = shard.accounts.first
+            while temp is not None:
+                yield temp
+                temp = temp.next
+
+    # Method to count transactions across all shards
+    def transaction_count(self):
+        return sum(shard.transactions.d_len for shard in self.shards)
+
+    # Method to count balances >= x across all shards
+    def count_at_least(self, x):
+        return sum(shard.accounts.balances.count_at_least(x) for shard in self.shards)
+
+    # Method to get the maximum balance across all shards (None when empty)
+    def max_balance(self):
+        maxes = [shard.accounts.balances.max_balance() for shard in self.shards]
+        maxes = [value for value in maxes if value is not None]
+        return max(maxes) if maxes else None
+
+    # Method to print number of accounts with balance >= x
+    def print_bal_more_x(self, x):
+        print(f"Number of accounts with balance >= {x}: {self.count_at_least(x)}")
+
+    # Method to print account number(s) with maximum balance
+    def print_max_balance(self):
+        best = self.max_balance()
+        holders = []
+        for shard in self.shards:
+            if shard.accounts.balances.max_balance() == best:
+                holders.extend(shard.accounts.balances.max_holders())
+        holders.sort(key=lambda node: node.position)
+        print("Account(s) with max balance: ", " ".join(str(node.acc_no) for node in holders))
+
+    # Method to print all transactions for account acc
+    def print_all_of_y(self, acc):
+        self.shard_of(acc).transactions.print_all_of_y(acc)
 
 # MAIN DRIVER FUNCTION
 def main():
-    accounts = SLL()        # Create an instance of SLL for accounts
-    transactions = DLL()    # Create an instance of DLL for transactions
-
-    # Input number of accounts and initialize accounts list
-    c = int(input("Enter number of accounts to create: "))
-    for i in range(c):
-        acs = int(input(f"Enter account number for account {i+1}: "))
-        accounts.push_node(acs)
-
-    # Input number of transactions and initialize transactions list
-    n = int(input("Enter number of transactions to record: "))
-    for i in range(n):
-        print(f"Enter transaction {i+1} in the format: <account number> <D for Deposit / W for Withdrawal> <amount>")
-        # (e.g., 101 D 500 → deposit ₹500 to account 101)
-        line = input("Transaction: ").split()
-        acs = int(line[0])
-        dw = line[1]
-        am = int(line[2])
-        transactions.push_d_node(acs, dw, am)
-
-    transactions.process_all(accounts)  # Process all recorded transactions immediately
+    parser = argparse.ArgumentParser(description="Banking system with linked lists")
+    parser.add_argument("--data-dir", help="keep a write-ahead log and snapshots here and recover from them")
+    parser.add_argument("--accounts", help="batch replay: accounts file (.csv or .bin)")
+    parser.add_argument("--transactions", help="batch replay: transactions file (.csv or .bin)")
+    parser.add_argument("--snapshot", default="balances.csv", help="batch replay: balance snapshot output (.csv)")
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # With input files, run the non-interactive batch replay instead of the prompts
+    if args.accounts or args.transactions:
+        if not (args.accounts and args.transactions):
+            parser.error("batch replay needs both --accounts and --transactions")
+        replay_files(args.accounts, args.transactions, args.snapshot, args.batch_size)
+        return
+
+    ledger = Ledger(args.data_dir)      # Accounts (SLL) and transactions (DLL)
+    accounts = ledger.accounts
+    transactions = ledger.transactions
+
+    if accounts.length > 0:
+        print(f"Recovered {accounts.length} account(s) and {transactions.d_len} transaction(s) from {args.data_dir}")
+    else:
+        # Input number of accounts and initialize accounts list
+        c = int(input("Enter number of accounts to create: "))
+        for i in range(c):
+            acs = int(input(f"Enter account number for account {i+1}: "))
+            ledger.push_node(acs)
+
+        # Input number of transactions and initialize transactions list
+        n = int(input("Enter number of transactions to record: "))
+        for i in range(n):
+            print(f"Enter transaction {i+1} in the format: <account number> <D for Deposit / W for Withdrawal> <amount>")
+            # (e.g., 101 D 500 → deposit ₹500 to account 101)
+            line = input("Transaction: ").split()
+            acs = int(line[0])
+            dw = line[1]
+            am = int(line[2])
+            try:
+                ledger.push_d_node(acs, dw, am)
+            except ValueError as e:
+                print(f"Transaction skipped: {e}")
+
+        ledger.process_all()  # Process all recorded transactions immediately
 
     print("\n--- Enter Commands ---")
     print("F x: Process next x transactions")
@@ -218,76 +999,81 @@ def main():
     while True:
         choice = input("\nEnter your command (F, R, I, D, C, S, G, M, V, E to exit): ").strip()
 
-        if choice == 'E':           # Exit the program
-            print("Exiting the program. Goodbye!")
-            break
-
-        elif choice.startswith('F'):    # Process next x transactions
-            x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter number of transactions to process: "))
-            transactions.process_x(x, accounts)
-            print(f"Processed {x} transaction(s).")
-
-        elif choice.startswith('R'):    # Undo last y transactions
-            y = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter number of transactions to undo: "))
-            transactions.undo_y(y, accounts)
-            print(f"Undid last {y} transaction(s).")
-
-        elif choice.startswith('I'):    # Insert transaction at position k
-            parts = choice.split()
-            if len(parts) >= 5:
-                acs = int(parts[1])
-                dw = parts[2]
-                am = int(parts[3])
-                k = int(parts[4])
-            else:
-                print("Enter transaction details in the format: <account number> <D/W> <amount> <position>")
-                line = input("Transaction: ").split()
-                acs = int(line[0])
-                dw = line[1]
-                am = int(line[2])
-                k = int(line[3])
-            transactions.insert_node_k(acs, dw, am, k, accounts)
-            print(f"Inserted transaction at position {k}.")
-
-        elif choice.startswith('D'):    # Delete m transactions for account acs
-            parts = choice.split()
-            if len(parts) >= 3:
-                acs = int(parts[1])
-                m = int(parts[2])
-            else:
-                print("Enter deletion details in the format: <account number> <number of transactions to delete>")
-                line = input("Delete: ").split()
-                acs = int(line[0])
-                m = int(line[1])
-            transactions.delete_am(acs, m, accounts)
-            print(f"Deleted {m} transaction(s) for account {acs}.")
-
-        elif choice == 'C':         # Process all remaining transactions
-            transactions.process_all(accounts)
-            print("Processed all remaining transactions.")
-
-        elif choice.startswith('S'):    # Print all transactions for account y
-            y = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter account number to view transactions: "))
-            print(f"Transactions for account {y}:")
-            transactions.print_all_of_y(y)
-
-        elif choice.startswith('G'):    # Print number of accounts with balance >= x
-            x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter the minimum balance to check: "))
-            print(f"Number of accounts with balance >= {x}:")
-            accounts.print_bal_more_x(x)
-
-        elif choice == 'M':         # Print account number(s) with maximum balance
-            print("Account(s) with maximum balance:")
-            accounts.print_max_balance()
-
-        elif choice.startswith('V'):    # Print balance of account with account number x
-            x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter account number to view balance: "))
-            print(f"Balance for account {x}: ")
-            accounts.print_bal_x(x)
+        try:
+            if choice == 'E':           # Exit the program
+                ledger.close()
+                print("Exiting the program. Goodbye!")
+                break
+
+            elif choice.startswith('F'):    # Process next x transactions
+                x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter number of transactions to process: "))
+                ledger.process_x(x)
+                print(f"Processed {x} transaction(s).")
+
+            elif choice.startswith('R'):    # Undo last y transactions
+                y = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter number of transactions to undo: "))
+                ledger.undo_y(y)
+                print(f"Undid last {y} transaction(s).")
+
+            elif choice.startswith('I'):    # Insert transaction at position k
+                parts = choice.split()
+                if len(parts) >= 5:
+                    acs = int(parts[1])
+                    dw = parts[2]
+                    am = int(parts[3])
+                    k = int(parts[4])
+                else:
+                    print("Enter transaction details in the format: <account number> <D/W> <amount> <position>")
+                    line = input("Transaction: ").split()
+                    acs = int(line[0])
+                    dw = line[1]
+                    am = int(line[2])
+                    k = int(line[3])
+                ledger.insert_node_k(acs, dw, am, k)
+                print(f"Inserted transaction at position {k}.")
+
+            elif choice.startswith('D'):    # Delete m transactions for account acs
+                parts = choice.split()
+                if len(parts) >= 3:
+                    acs = int(parts[1])
+                    m = int(parts[2])
+                else:
+                    print("Enter deletion details in the format: <account number> <number of transactions to delete>")
+                    line = input("Delete: ").split()
+                    acs = int(line[0])
+                    m = int(line[1])
+                ledger.delete_am(acs, m)
+                print(f"Deleted {m} transaction(s) for account {acs}.")
+
+            elif choice == 'C':         # Process all remaining transactions
+                ledger.process_all()
+                print("Processed all remaining transactions.")
+
+            elif choice.startswith('S'):    # Print all transactions for account y
+                y = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter account number to view transactions: "))
+                print(f"Transactions for account {y}:")
+                transactions.print_all_of_y(y)
+
+            elif choice.startswith('G'):    # Print number of accounts with balance >= x
+                x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter the minimum balance to check: "))
+                print(f"Number of accounts with balance >= {x}:")
+                accounts.print_bal_more_x(x)
+
+            elif choice == 'M':         # Print account number(s) with maximum balance
+                print("Account(s) with maximum balance:")
+                accounts.print_max_balance()
+
+            elif choice.startswith('V'):    # Print balance of account with account number x
+                x = int(choice.split()[1]) if len(choice.split()) > 1 else int(input("Enter account number to view balance: "))
+                print(f"Balance for account {x}: ")
+                accounts.print_bal_x(x)
             
-        elif choice == 'T':  # Transfer money between accounts
-            from_acc, to_acc, amount = map(int, input("Enter transfer details (from account, to account, amount): ").split())
-            result = accounts.transfer_amount(from_acc, to_acc, amount, dll=transactions)
+            elif choice == 'T':  # Transfer money between accounts
+                from_acc, to_acc, amount = map(int, input("Enter transfer details (from account, to account, amount): ").split())
+                ledger.transfer_amount(from_acc, to_acc, amount)
+        except ValueError as e:
+            # Rejected before anything was logged
+            print(f"Invalid command: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,228 @@
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import BankingSystem
+from BankingSystem import DLL, SLL, TRANSACTION_RECORD, ConcurrentLedger, replay_files
+
+# Account lookup the way SLL.find_node used to do it: walk the whole list
+def linear_find_node(accounts, acc):
+    temp = accounts.first
+    while temp is not None:
+        if temp.acc_no == acc:
+            return temp
+        temp = temp.next
+    return None
+
+# Build an account list with account numbers 1..num_accounts
+def build_accounts(num_accounts):
+    accounts = SLL()
+    for acc in range(1, num_accounts + 1):
+        accounts.push_node(acc)
+    return accounts
+
+# Generate random (acc, D/W, amount) transactions
+def generate_transactions(num_accounts, num_transactions, seed=0):
+    rng = random.Random(seed)
+    for _ in range(num_transactions):
+        yield rng.randint(1, num_accounts), rng.choice('DW'), rng.randint(1, 500)
+
+# Compare indexed lookups against the old linear scan
+def bench_lookup(args):
+    print(f"Building {args.accounts} accounts...")
+    accounts = build_accounts(args.accounts)
+
+    # Indexed: every transaction goes through SLL.transaction
+    start = time.perf_counter()
+    for acc, mode, val in generate_transactions(args.accounts, args.transactions, args.seed):
+        accounts.transaction(acc, mode, val)
+    indexed = time.perf_counter() - start
+    print(f"Indexed: {args.transactions} transactions in {indexed:.2f}s "
+          f"({args.transactions / indexed:,.0f} tx/s)")
+
+    # Linear scan: too slow for the full run, so time a sample and extrapolate
+    start = time.perf_counter()
+    for acc, mode, val in generate_transactions(args.accounts, args.scan_sample, args.seed):
+        node = linear_find_node(accounts, acc)
+        if node is not None:
+            node.balance += val if mode == 'D' else -val
+    per_tx = (time.perf_counter() - start) / args.scan_sample
+    linear = per_tx * args.transactions
+    print(f"Linear scan: {per_tx * 1e3:.3f} ms/tx over {args.scan_sample} sampled transactions, "
+          f"~{linear:,.0f}s estimated for {args.transactions}")
+    print(f"Speedup: ~{linear / indexed:,.0f}x")
+
+# Compare indexed balance queries against full list scans
+def bench_queries(args):
+    print(f"Building {args.accounts} accounts...")
+    accounts = build_accounts(args.accounts)
+    for acc, mode, val in generate_transactions(args.accounts, args.accounts, args.seed):
+        accounts.transaction(acc, mode, val)
+    rng = random.Random(args.seed)
+    thresholds = [rng.randint(500, 1500) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    for x in thresholds:
+        accounts.balances.count_at_least(x)
+        accounts.balances.max_holders()
+    indexed = (time.perf_counter() - start) / args.queries
+
+    start = time.perf_counter()
+    for x in thresholds:
+        count = 0
+        max_balance = None
+        temp = accounts.first
+        while temp is not None:
+            if temp.balance >= x:
+                count += 1
+            if max_balance is None or temp.balance > max_balance:
+                max_balance = temp.balance
+            temp = temp.next
+    scan = (time.perf_counter() - start) / args.queries
+
+    print(f"Indexed: {indexed * 1e6:.1f} us per count + max query")
+    print(f"List scan: {scan * 1e6:.1f} us per count + max query")
+    print(f"Speedup: ~{scan / indexed:,.0f}x")
+
+# Write account/transaction files and time the batch replay mode
+def bench_replay(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        ext = '.bin' if args.binary else '.csv'
+        accounts_path = os.path.join(tmp, 'accounts' + ext)
+        transactions_path = os.path.join(tmp, 'transactions' + ext)
+        print(f"Writing {args.accounts} accounts and {args.transactions} transactions ({ext})...")
+        if args.binary:
+            with open(accounts_path, 'wb') as f:
+                for acc in range(1, args.accounts + 1):
+                    f.write(acc.to_bytes(8, 'little', signed=True))
+            with open(transactions_path, 'wb') as f:
+                for acc, mode, val in generate_transactions(args.accounts, args.transactions, args.seed):
+                    f.write(TRANSACTION_RECORD.pack(acc, mode.encode(), val))
+        else:
+            with open(accounts_path, 'w') as f:
+                f.writelines(f"{acc}\n" for acc in range(1, args.accounts + 1))
+            with open(transactions_path, 'w') as f:
+                f.writelines(f"{acc},{mode},{val}\n"
+                             for acc, mode, val in generate_transactions(args.accounts, args.transactions, args.seed))
+        replay_files(accounts_path, transactions_path, os.path.join(tmp, 'balances.csv'), args.batch_size)
+
+# Measure concurrent transfer throughput as threads scale and check money is conserved
+def bench_concurrent(args):
+    for num_threads in args.threads:
+        ledger = ConcurrentLedger(range(1, args.accounts + 1), args.shards)
+        total_before = ledger.length * 1000
+        per_thread = args.transfers // num_threads
+        completed = [0] * num_threads
+
+        def worker(worker_id):
+            rng = random.Random(args.seed + worker_id)
+            done = 0
+            for _ in range(per_thread):
+                from_acc = rng.randint(1, args.accounts)
+                to_acc = rng.randint(1, args.accounts)
+                if ledger.transfer_amount(from_acc, to_acc, rng.randint(1, 300)):
+                    done += 1
+            completed[worker_id] = done
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        # Verify: money conserved, no overdraft, balance index consistent, both legs logged
+        balances = [node.balance for node in ledger.nodes()]
+        conserved = sum(balances) == total_before
+        no_overdraft = min(balances) >= 0
+        index_ok = (ledger.count_at_least(0) == len(balances)
+                    and ledger.max_balance() == max(balances))
+        logged = ledger.transaction_count() == 2 * sum(completed)
+        status = "OK" if conserved and no_overdraft and index_ok and logged else "FAILED"
+        print(f"{num_threads:3d} thread(s): {num_threads * per_thread / elapsed:12,.0f} transfers/s "
+              f"({sum(completed)} applied), money conserved and index consistent: {status}")
+
+# Traced bytes allocated by build() divided by the number of records
+def bytes_per_record(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+# Report memory per account and per transaction record, with and without __slots__
+def bench_memory(args):
+    records = list(generate_transactions(args.accounts, args.transactions, args.seed))
+
+    def build_transactions():
+        transactions = DLL()
+        for acc, mode, val in records:
+            transactions.push_d_node(acc, mode, val)
+        return transactions
+
+    slotted = (BankingSystem.Node, BankingSystem.DNode)
+    for label in ("__slots__", "__dict__"):
+        if label == "__dict__":
+            # Subclasses without __slots__ get a per-instance __dict__ again
+            BankingSystem.Node = type("Node", (slotted[0],), {})
+            BankingSystem.DNode = type("DNode", (slotted[1],), {})
+        try:
+            per_account = bytes_per_record(lambda: build_accounts(args.accounts), args.accounts)
+            per_transaction = bytes_per_record(build_transactions, args.transactions)
+        finally:
+            BankingSystem.Node, BankingSystem.DNode = slotted
+        print(f"{label:9s}: {per_account:6.1f} bytes/account, {per_transaction:6.1f} bytes/transaction "
+              f"(including indexes)")
+
+def main():
+    parser = argparse.ArgumentParser(description="BankingSystem benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    lookup = subparsers.add_parser("lookup", help="indexed vs linear account lookup")
+    lookup.add_argument("--accounts", type=int, default=1_000_000)
+    lookup.add_argument("--transactions", type=int, default=10_000_000)
+    lookup.add_argument("--scan-sample", type=int, default=100,
+                        help="transactions timed with the linear scan")
+    lookup.add_argument("--seed", type=int, default=0)
+    lookup.set_defaults(func=bench_lookup)
+
+    queries = subparsers.add_parser("queries", help="indexed vs scanned balance queries")
+    queries.add_argument("--accounts", type=int, default=1_000_000)
+    queries.add_argument("--queries", type=int, default=20)
+    queries.add_argument("--seed", type=int, default=0)
+    queries.set_defaults(func=bench_queries)
+
+    replay = subparsers.add_parser("replay", help="batch file replay throughput")
+    replay.add_argument("--accounts", type=int, default=1_000_000)
+    replay.add_argument("--transactions", type=int, default=10_000_000)
+    replay.add_argument("--batch-size", type=int, default=1_000_000)
+    replay.add_argument("--binary", action="store_true", help="use the binary file formats")
+    replay.add_argument("--seed", type=int, default=0)
+    replay.set_defaults(func=bench_replay)
+
+    concurrent = subparsers.add_parser("concurrent", help="threaded transfer stress test")
+    concurrent.add_argument("--accounts", type=int, default=10_000)
+    concurrent.add_argument("--transfers", type=int, default=400_000)
+    concurrent.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    concurrent.add_argument("--shards", type=int, default=256)
+    concurrent.add_argument("--seed", type=int, default=0)
+    concurrent.set_defaults(func=bench_concurrent)
+
+    memory = subparsers.add_parser("memory", help="bytes per account and transaction record")
+    memory.add_argument("--accounts", type=int, default=100_000)
+    memory.add_argument("--transactions", type=int, default=1_000_000)
+    memory.add_argument("--seed", type=int, default=0)
+    memory.set_defaults(func=bench_memory)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+import argparse
+import asyncio
+import io
+import json
+import random
+import signal
+import sys
+import time
+from contextlib import redirect_stdout
+
+from BankingSystem import INT64_MAX, INT64_MIN, Ledger
+
+# Commands that change state; they are logged and group-committed.
+# A (add account) and P (push transaction) are extra, so clients can load data.
+MUTATIONS = {'A', 'P', 'F', 'R', 'I', 'D', 'C', 'T'}
+
+# Number of integer arguments each command takes (I and P also take a D/W action)
+ARITY = {'A': 1, 'P': 3, 'F': 1, 'R': 1, 'I': 4, 'D': 2, 'C': 0, 'T': 3,
+         'S': 1, 'G': 1, 'M': 0, 'V': 1}
+
+# Function to parse a command line into (letter, args); raises ValueError if malformed
+def parse_command(line):
+    parts = line.split()
+    if not parts or parts[0] not in ARITY:
+        raise ValueError(f"unknown command: {line!r}")
+    op, args = parts[0], parts[1:]
+    if len(args) != ARITY[op]:
+        raise ValueError(f"{op} takes {ARITY[op]} argument(s)")
+    if op in ('P', 'I'):
+        if args[1] not in ('D', 'W'):
+            raise ValueError("action must be D or W")
+        values = [int(args[0]), args[1]] + [int(arg) for arg in args[2:]]
+    else:
+        values = [int(arg) for arg in args]
+    for value in values:
+        if isinstance(value, int) and not INT64_MIN <= value <= INT64_MAX:
+            raise ValueError(f"{value} is not a 64-bit integer")
+    return op, values
+
+# Function to run a parsed command on the ledger and return what it printed
+def run_command(ledger, op, args):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        if op == 'A':
+            ledger.push_node(*args)
+        elif op == 'P':
+            ledger.push_d_node(*args)
+        elif op == 'F':
+            ledger.process_x(*args)
+        elif op == 'R':
+            ledger.undo_y(*args)
+        elif op == 'I':
+            ledger.insert_node_k(*args)
+        elif op == 'D':
+            ledger.delete_am(*args)
+        elif op == 'C':
+            ledger.process_all()
+        elif op == 'T':
+            ledger.transfer_amount(*args)
+        elif op == 'S':
+            ledger.transactions.print_all_of_y(*args)
+        elif op == 'G':
+            ledger.accounts.print_bal_more_x(*args)
+        elif op == 'M':
+            ledger.accounts.print_max_balance()
+        elif op == 'V':
+            ledger.accounts.print_bal_x(*args)
+    return output.getvalue().rstrip("\n")
+
+# Function to get the p-th percentile of a list of numbers
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+# Asyncio ledger service. Requests from all connections go into one queue; a
+# single batcher applies them in arrival order, fsyncs the log once per batch
+# (group commit) and only then replies, so no client sees an undurable result.
+# If a commit fails, the in-memory state no longer matches what is known to be
+# on disk, so the server stops serving instead of carrying on from it.
+class LedgerServer:
+    def __init__(self, ledger, max_batch=512, max_delay=0.002):
+        self.ledger = ledger
+        self.max_batch = max_batch      # Most requests applied per group commit
+        self.max_delay = max_delay      # Longest wait (seconds) to fill a batch
+        self.queue = asyncio.Queue()
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.batches = 0
+        self.commits = 0
+        self.latencies = []             # Seconds from arrival to reply, recent requests
+        self.failure = None             # Error of a failed group commit, once one fails
+        self.stop = None                # Set to shut the server down (created by serve)
+
+    # Coroutine serving one client connection (one JSON reply per command line)
+    async def handle_client(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.decode().strip()
+                if not line:
+                    continue
+                if line == 'STATS':
+                    reply = {"ok": True, "stats": self.stats()}
+                elif self.failure is not None:
+                    reply = {"ok": False, "error": self.failure}
+                else:
+                    future = loop.create_future()
+                    await self.queue.put((line, time.perf_counter(), future))
+                    reply = await future
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # Coroutine collecting requests into batches and group-committing them
+    async def batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            replies = []
+            mutated = False
+            for line, arrived, future in batch:
+                try:
+                    op, args = parse_command(line)
+                    # Set before running: a command can fail after its record was logged
+                    mutated = mutated or op in MUTATIONS
+                    output = run_command(self.ledger, op, args)
+                    replies.append({"ok": True, "output": output})
+                except Exception as e:
+                    # One bad request must not take down the batcher every client waits on
+                    replies.append({"ok": False, "error": str(e)})
+
+            # One fsync covers every mutation in the batch
+            if mutated and self.ledger.wal is not None:
+                try:
+                    await loop.run_in_executor(None, self.ledger.wal.sync)
+                    self.commits += 1
+                except Exception as e:
+                    # The batch may or may not reach the disk later, so its
+                    # outcome is unknown and nothing more can be served
+                    self.failure = f"commit failed ({e}); outcome unknown, server stopped"
+                    replies = [{"ok": False, "error": self.failure}] * len(batch)
+
+            now = time.perf_counter()
+            for (line, arrived, future), reply in zip(batch, replies):
+                self.latencies.append(now - arrived)
+                if not future.done():
+                    future.set_result(reply)
+            del self.latencies[:-100_000]
+            self.requests += len(batch)
+            self.batches += 1
+
+            if self.failure is not None:
+                # Fail whatever is still queued and shut down
+                while not self.queue.empty():
+                    line, arrived, future = self.queue.get_nowait()
+                    if not future.done():
+                        future.set_result({"ok": False, "error": self.failure})
+                if self.stop is not None:
+                    self.stop.set()
+                return
+
+    # Method to summarize throughput, batching and latency
+    def stats(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "group_commits": self.commits,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+            "requests_per_s": self.requests / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_ms": percentile(self.latencies, 50) * 1e3,
+            "latency_p99_ms": percentile(self.latencies, 99) * 1e3,
+        }
+
+    # Coroutine running the server until SIGINT/SIGTERM
+    async def serve(self, host, port):
+        loop = asyncio.get_running_loop()
+        self.stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop.set)
+            except NotImplementedError:     # Not available on Windows
+                pass
+
+        server = await asyncio.start_server(self.handle_client, host, port)
+        batcher = asyncio.create_task(self.batcher())
+        print(f"Ledger server listening on {host}:{port}", flush=True)
+        async with server:
+            await self.stop.wait()
+        batcher.cancel()
+        if self.failure is not None:
+            print(f"Group {self.failure}", file=sys.stderr)
+        print("Ledger server stopped:", self.stats())
+
+# Coroutine for one load-generating client; returns per-request latencies
+async def client_session(host, port, num_requests, num_accounts, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    latencies = []
+    for _ in range(num_requests):
+        roll = rng.random()
+        acc = rng.randint(1, num_accounts)
+        if roll < 0.5:
+            command = f"T {acc} {rng.randint(1, num_accounts)} {rng.randint(1, 100)}"
+        elif roll < 0.7:
+            command = f"P {acc} {rng.choice('DW')} {rng.randint(1, 100)}"
+        elif roll < 0.8:
+            command = "C"
+        else:
+            command = f"V {acc}"
+        start = time.perf_counter()
+        writer.write((command + "\n").encode())
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if not reply["ok"]:
+            raise RuntimeError(reply["error"])
+    writer.close()
+    return latencies
+
+# Coroutine running many concurrent clients against a server and reporting results
+async def load_generator(host, port, clients, requests_per_client, num_accounts):
+    # Make sure the accounts exist (re-adding an existing number is harmless for the load)
+    reader, writer = await asyncio.open_connection(host, port)
+    for acc in range(1, num_accounts + 1):
+        writer.write(f"V {acc}\n".encode())
+        await writer.drain()
+        if not json.loads(await reader.readline())["output"]:
+            writer.write(f"A {acc}\n".encode())
+            await writer.drain()
+            await reader.readline()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client_session(host, port, requests_per_client, num_accounts, seed)
+                                     for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies = [latency for result in results for latency in result]
+    print(f"{len(latencies)} requests from {clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} requests/s)")
+    print(f"Client latency p50 {percentile(latencies, 50) * 1e3:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1e3:.2f} ms")
+
+    writer.write(b"STATS\n")
+    await writer.drain()
+    print("Server stats:", json.loads(await reader.readline())["stats"])
+    writer.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Asynchronous BankingSystem ledger service")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    serve = subparsers.add_parser("serve", help="run the ledger server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--data-dir", help="write-ahead log and snapshot directory")
+    serve.add_argument("--max-batch", type=int, default=512)
+    serve.add_argument("--max-delay-ms", type=float, default=2.0)
+
+    loadgen = subparsers.add_parser("loadgen", help="generate load against a running server")
+    loadgen.add_argument("--host", default="127.0.0.1")
+    loadgen.add_argument("--port", type=int, default=8765)
+    loadgen.add_argument("--clients", type=int, default=50)
+    loadgen.add_argument("--requests", type=int, default=1000, help="requests per client")
+    loadgen.add_argument("--accounts", type=int, default=1000)
+
+    args = parser.parse_args()
+    if args.mode == "serve":
+        # The batcher fsyncs once per batch, so the log itself never syncs on its own
+        ledger = Ledger(args.data_dir, sync_every=sys.maxsize)
+        server = LedgerServer(ledger, args.max_batch, args.max_delay_ms / 1000)
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # After a failed commit the memory state may hold changes clients
+            # were told failed, so it must not be checkpointed; the next start
+            # recovers from what reached the log
+            if server.failure is None:
+                ledger.close()
+        if server.failure is not None:
+            sys.exit(1)
+    else:
+        asyncio.run(load_generator(args.host, args.port, args.clients, args.requests, args.accounts))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import time
+import tracemalloc
+
+from d_u import Arrivals, Scheduler, algorithm_label
+from workloads import SERVICE_DISTRIBUTIONS, generate_workload
+
+# The ready-process selection the algorithms used before the heaps: scan every ready process
+
+def scan_shortest_process_next(scheduler):
+    processes = scheduler.workload.processes
+    arrivals = Arrivals(processes)
+    ready = []
+    current_time = 0
+    processed_count = 0
+    while processed_count < len(processes):
+        ready.extend(arrivals.admit(current_time))
+        if not ready:
+            current_time = arrivals.next_time()
+            continue
+        index = min(ready, key=lambda i: (processes[i][2], i))
+        ready.remove(index)
+        scheduler.run_process(index, current_time, current_time + processes[index][2])
+        current_time += processes[index][2]
+        processed_count += 1
+
+def scan_shortest_remaining_time(scheduler):
+    processes = scheduler.workload.processes
+    remaining_service_time = [p[2] for p in processes]
+    arrivals = Arrivals(processes)
+    ready = []
+    current_time = 0
+    processed_count = 0
+    while processed_count < len(processes):
+        ready.extend(arrivals.admit(current_time))
+        if not ready:
+            current_time = arrivals.next_time()
+            continue
+        index = min(ready, key=lambda i: (remaining_service_time[i], i))
+        end = current_time + remaining_service_time[index]
+        next_arrival = arrivals.next_time()
+        if next_arrival is not None and next_arrival < end:
+            end = next_arrival
+        scheduler.run_process(index, current_time, end)
+        remaining_service_time[index] -= end - current_time
+        current_time = end
+        if remaining_service_time[index] == 0:
+            ready.remove(index)
+            processed_count += 1
+
+def scan_highest_response_ratio_next(scheduler):
+    processes = scheduler.workload.processes
+    arrivals = Arrivals(processes)
+    ready = []
+    current_time = 0
+    processed_count = 0
+    while processed_count < len(processes):
+        ready.extend(arrivals.admit(current_time))
+        if not ready:
+            current_time = arrivals.next_time()
+            continue
+        max_response_ratio = -1
+        index = -1
+        for i in ready:
+            response_ratio = float(current_time - processes[i][1] + processes[i][2]) / processes[i][2]
+            if response_ratio > max_response_ratio or (response_ratio == max_response_ratio and i < index):
+                max_response_ratio = response_ratio
+                index = i
+        ready.remove(index)
+        scheduler.run_process(index, current_time, current_time + processes[index][2])
+        current_time += processes[index][2]
+        processed_count += 1
+
+def scan_aging(scheduler, quantum):
+    processes = scheduler.workload.processes
+    remaining_service_time = [p[2] for p in processes]
+    priority = [0] * len(processes)
+    arrivals = Arrivals(processes)
+    active = []
+    current_time = 0
+    processed_count = 0
+    while processed_count < len(processes):
+        active.extend(arrivals.admit(current_time))
+        if active:
+            index = max(active, key=lambda i: (priority[i], -i))
+            execution_time = min(quantum, remaining_service_time[index])
+            scheduler.run_process(index, current_time, current_time + execution_time)
+            current_time += execution_time
+            remaining_service_time[index] -= execution_time
+            if remaining_service_time[index] <= 0:
+                active.remove(index)
+                processed_count += 1
+        else:
+            current_time = arrivals.next_time()
+        active.extend(arrivals.admit(current_time))
+        for i in active:
+            priority[i] += 1
+
+# Time heap-based selection against the old scan as the process count grows
+def bench_queues(args):
+    algorithms = [
+        ("SPN", lambda scheduler: scheduler.shortest_process_next(), scan_shortest_process_next),
+        ("SRT", lambda scheduler: scheduler.shortest_remaining_time(), scan_shortest_remaining_time),
+        ("HRRN", lambda scheduler: scheduler.highest_response_ratio_next(), scan_highest_response_ratio_next),
+        (f"Aging-{args.quantum}", lambda scheduler: scheduler.aging(args.quantum),
+         lambda scheduler: scan_aging(scheduler, args.quantum)),
+    ]
+    print(f"{'processes':>10} {'algorithm':>9} {'heap s':>9} {'scan s':>9} {'speedup':>8}")
+    for num_processes in args.processes:
+        workload = generate_workload(num_processes, "exponential", 10.0, args.load, args.seed)
+        for name, heap_version, scan_version in algorithms:
+            heap_scheduler = Scheduler(workload)
+            start = time.perf_counter()
+            heap_version(heap_scheduler)
+            heap_time = time.perf_counter() - start
+
+            if num_processes > args.scan_limit:
+                print(f"{num_processes:10d} {name:>9} {heap_time:9.3f} {'-':>9} {'-':>8}")
+                continue
+            scan_scheduler = Scheduler(workload)
+            start = time.perf_counter()
+            scan_version(scan_scheduler)
+            scan_time = time.perf_counter() - start
+            same = "" if scan_scheduler.timeline == heap_scheduler.timeline else "  (results differ!)"
+            print(f"{num_processes:10d} {name:>9} {heap_time:9.3f} {scan_time:9.3f} "
+                  f"{scan_time / heap_time:7.1f}x{same}")
+
+# Time every algorithm on generated workloads as process count and horizon grow
+def bench_suite(args):
+    algorithms = [('1', -1), ('2', args.quantum), ('3', -1), ('4', -1), ('5', -1), ('6', -1), ('7', -1),
+                  ('8', args.quantum)]
+    print(f"{'processes':>10} {'mean svc':>8} {'horizon':>10} {'algorithm':>9} {'seconds':>8} "
+          f"{'ticks/s':>12} {'peak MiB':>9}")
+    for num_processes in args.processes:
+        for mean_service in args.mean_service:
+            workload = generate_workload(num_processes, args.service, mean_service, args.load, args.seed)
+            for algorithm_id, quantum in algorithms:
+                label = algorithm_label(algorithm_id, quantum).strip()
+                if algorithm_id == '8':
+                    label += f"-{quantum}"
+                scheduler = Scheduler(workload)
+                start = time.perf_counter()
+                finish_time, turn_around_time, norm_turn = scheduler.run(algorithm_id, quantum)
+                elapsed = time.perf_counter() - start
+                # Simulated time covered: up to the last completion
+                horizon = max(finish_time) if num_processes else 0
+
+                peak = float('nan')
+                if not args.no_memory:
+                    # Separate traced run: tracemalloc slows the simulation down
+                    tracemalloc.start()
+                    Scheduler(workload).run(algorithm_id, quantum)
+                    peak = tracemalloc.get_traced_memory()[1] / 2**20
+                    tracemalloc.stop()
+                print(f"{num_processes:10d} {mean_service:8g} {horizon:10d} {label:>9} {elapsed:8.3f} "
+                      f"{horizon / elapsed:12,.0f} {peak:9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU scheduling benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    queues = subparsers.add_parser("queues", help="heap ready queues vs linear scans")
+    queues.add_argument("--processes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    queues.add_argument("--scan-limit", type=int, default=10_000,
+                        help="largest process count also run with the scan (it is quadratic)")
+    queues.add_argument("--quantum", type=int, default=4, help="Aging quantum")
+    queues.add_argument("--load", type=float, default=1.2, help="arrival rate / service rate")
+    queues.add_argument("--seed", type=int, default=0)
+    queues.set_defaults(func=bench_queues)
+
+    suite = subparsers.add_parser("suite", help="every algorithm on generated workloads: ticks/s and memory")
+    suite.add_argument("--processes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    suite.add_argument("--mean-service", type=float, nargs="+", default=[10.0, 100.0],
+                       help="mean service times (the horizon grows with them)")
+    suite.add_argument("--service", choices=SERVICE_DISTRIBUTIONS, default="exponential")
+    suite.add_argument("--load", type=float, default=0.9, help="arrival rate x mean service time")
+    suite.add_argument("--quantum", type=int, default=4, help="RR and Aging quantum")
+    suite.add_argument("--no-memory", action="store_true", help="skip the traced run for peak memory")
+    suite.add_argument("--seed", type=int, default=0)
+    suite.set_defaults(func=bench_suite)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -54,4 +54,4 @@ def parse():
     finishTime = [0] * process_count
     turnAroundTime = [0] * process_count
     normTurn = [0.0] * process_count
-    timeline = [[' ' for _ in range(process_count)] for _ in range(last_instant)]
\ No newline at end of file
+    timeline = []   # Execution log of (process index, start, end) segments
\ No newline at end of file
@@ -1,5 +1,7 @@
 import sys
+from array import array
 from collections import deque
+import heapq
 import math
 
 # Global Constants
@@ -7,21 +9,9 @@ TRACE = "trace"
 SHOW_STATISTICS = "stats"
 ALGORITHMS = ["", "FCFS", "RR-", "SPN", "SRT", "HRRN", "FB-1", "FB-2i", "Aging"]
 
-# Global Variables
-processes = []
-algorithms = []
-process_to_index = {}
-timeline = []
-finish_time = []
-turn_around_time = []
-norm_turn = []
-operation = ""
-last_instant = 0
-process_count = 0
-
 def parse_algorithms(algorithm_chunk):
-    """Parse the algorithm string and populate algorithms list."""
-    global algorithms
+    """Parse the algorithm string into a list of (algorithm_id, quantum) pairs."""
+    algorithms = []
     algorithm_parts = algorithm_chunk.split(',')
     for part in algorithm_parts:
         if '-' in part:
@@ -32,10 +22,11 @@ def parse_algorithms(algorithm_chunk):
             algorithm_id = part[0]
             quantum = -1
         algorithms.append((algorithm_id, quantum))
+    return algorithms
 
-def parse_processes():
-    """Parse process information from input."""
-    global processes, process_to_index
+def parse_processes(process_count):
+    """Parse process information from input into (name, arrival, service) tuples."""
+    processes = []
     for i in range(process_count):
         process_chunk = input().strip()
         parts = process_chunk.split(',')
@@ -44,267 +35,364 @@ def parse_processes():
         process_service_time = int(parts[2])
         
         processes.append((process_name, process_arrival_time, process_service_time))
-        process_to_index[process_name] = i
+    return processes
 
 def parse():
-    """Parse all input data."""
-    global operation, last_instant, process_count, finish_time, turn_around_time, norm_turn, timeline
-    
+    """Parse all input data; returns (operation, algorithms, workload)."""
     line = input().strip().split()
     operation = line[0]
     algorithm_chunk = line[1]
     last_instant = int(line[2])
     process_count = int(line[3])
     
-    parse_algorithms(algorithm_chunk)
-    parse_processes()
-    
-    finish_time = [0] * process_count
-    turn_around_time = [0] * process_count
-    norm_turn = [0.0] * process_count
-    timeline = [[' ' for _ in range(process_count)] for _ in range(last_instant)]
+    algorithms = parse_algorithms(algorithm_chunk)
+    workload = Workload(parse_processes(process_count), last_instant)
+    return operation, algorithms, workload
 
-def clear_timeline():
-    """Clear the timeline for next algorithm execution."""
-    global timeline
-    for i in range(last_instant):
-        for j in range(process_count):
-            timeline[i][j] = ' '
+def read_workload(path):
+    """Read a workload file: the stdin format, where the header line is optional.
 
-def print_finish_time():
-    """Print finish times for all processes."""
-    for i in range(process_count):
-        print(f"Process {processes[i][0]} finished at time {finish_time[i]}")
+    Only last_instant is taken from the header; each remaining line is name,arrival,service.
+    """
+    with open(path) as workload_file:
+        lines = [line.strip() for line in workload_file if line.strip()]
+    last_instant = 0
+    if lines and len(lines[0].split()) == 4:
+        last_instant = int(lines[0].split()[2])
+        lines = lines[1:]
+    processes = []
+    for line in lines:
+        parts = line.split(',')
+        processes.append((parts[0], int(parts[1]), int(parts[2])))
+    return Workload(processes, last_instant)
 
-def print_turn_around_time():
-    """Print turnaround times for all processes."""
-    for i in range(process_count):
-        print(f"Process {processes[i][0]} turnaround time is {turn_around_time[i]}")
+def algorithm_label(algorithm_id, quantum):
+    """Return the trace label of an algorithm, e.g. "RR-2  "."""
+    if algorithm_id == '2':
+        return f"RR-{quantum}  "
+    return f"{ALGORITHMS[int(algorithm_id)]:<6}"
 
-def print_norm_turn():
-    """Print normalized turnaround times for all processes."""
-    for i in range(process_count):
-        print(f"Process {processes[i][0]} normalized turnaround time is {norm_turn[i]}")
-
-def print_timeline(algorithm_index):
-    """Print the execution timeline."""
-    # Print time header
-    for i in range(last_instant + 1):
-        print(i % 10, end=" ")
-    print()
-    print("-" * 48)
+class Workload:
+    """A set of processes to schedule: (name, arrival, service) tuples and the trace horizon."""
+    def __init__(self, processes, last_instant=0):
+        self.processes = list(processes)
+        self.last_instant = last_instant
+        self.process_to_index = {name: i for i, (name, arrival, service) in enumerate(self.processes)}
     
-    # Print process timelines
-    for i in range(process_count):
-        print(f"{processes[i][0]}     |", end="")
-        for j in range(last_instant):
-            print(f"{timeline[j][i]}|", end="")
-        print(" ")
-    print("-" * 48)
+    @property
+    def process_count(self):
+        return len(self.processes)
 
-def print_stats(algorithm_index):
-    """Print statistics for the algorithm."""
-    print_finish_time()
-    print_turn_around_time()
-    print_norm_turn()
+class Arrivals:
+    """Processes sorted once by arrival time, released as the simulation clock reaches them.
 
-def first_come_first_serve():
-    """Implement First Come First Serve scheduling algorithm."""
-    current_time = 0
-    for i in range(process_count):
-        arrival = processes[i][1]
-        service = processes[i][2]
-        current_time = max(current_time, arrival)
-        
-        for j in range(service):
-            timeline[current_time][i] = '*'
-            current_time += 1
-        
-        finish_time[i] = current_time
-        turn_around_time[i] = finish_time[i] - arrival
-        norm_turn[i] = float(turn_around_time[i]) / service
+    The algorithms below are event driven: instead of advancing the clock one
+    tick at a time and rescanning every process for arrivals, they jump straight
+    to the next arrival or completion. Processes arriving at the same time keep
+    their input order, as they did with the per-tick scan.
+    """
+    def __init__(self, processes):
+        self.processes = processes
+        self.order = sorted(range(len(processes)), key=lambda i: processes[i][1])
+        self.next = 0
 
-def round_robin(quantum):
-    """Implement Round Robin scheduling algorithm."""
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    ready_queue = deque()
-    current_time = 0
-    processed_count = 0
+    def admit(self, current_time):
+        """Return the indices of all not yet admitted processes arrived by current_time."""
+        start = self.next
+        while self.next < len(self.order) and self.processes[self.order[self.next]][1] <= current_time:
+            self.next += 1
+        return self.order[start:self.next]
+
+    def next_time(self):
+        """Return the arrival time of the next process not yet admitted (None if all arrived)."""
+        if self.next < len(self.order):
+            return self.processes[self.order[self.next]][1]
+        return None
+
+class Scheduler:
+    """Runs the scheduling algorithms on one workload.
+
+    All simulation state lives on the instance, so independent schedulers can
+    run side by side in threads or processes. After run(), timeline holds the
+    execution log of (process index, start, end) segments in time order and
+    finish_time, turn_around_time and norm_turn hold per-process statistics.
+    """
+    def __init__(self, workload):
+        self.workload = workload
+        self.reset()
+    
+    def reset(self):
+        """Clear the timeline and statistics for the next algorithm execution."""
+        count = self.workload.process_count
+        self.timeline = []
+        self.finish_time = array('q', bytes(8 * count))
+        self.turn_around_time = array('q', bytes(8 * count))
+        self.norm_turn = array('d', bytes(8 * count))
+    
+    def run(self, algorithm_id, quantum=-1):
+        """Run one algorithm; returns (finish_time, turn_around_time, norm_turn) arrays."""
+        self.reset()
+        if algorithm_id == '1':
+            self.first_come_first_serve()
+        elif algorithm_id == '2':
+            self.round_robin(quantum)
+        elif algorithm_id == '3':
+            self.shortest_process_next()
+        elif algorithm_id == '4':
+            self.shortest_remaining_time()
+        elif algorithm_id == '5':
+            self.highest_response_ratio_next()
+        elif algorithm_id == '6':
+            self.feedback_q1()
+        elif algorithm_id == '7':
+            self.feedback_q2i()
+        elif algorithm_id == '8':
+            self.aging(quantum)
+        else:
+            raise ValueError(f"unknown algorithm: {algorithm_id!r}")
+        self.compute_statistics()
+        return self.finish_time, self.turn_around_time, self.norm_turn
+    
+    def run_process(self, index, start, end):
+        """Log that a process runs from start up to (not including) end."""
+        if start == end:
+            return
+        timeline = self.timeline
+        if timeline and timeline[-1][0] == index and timeline[-1][2] == start:
+            # Same process continuing: extend its segment instead of adding one
+            timeline[-1] = (index, timeline[-1][1], end)
+        else:
+            timeline.append((index, start, end))
+    
+    def compute_statistics(self):
+        """Derive finish, turnaround and normalized turnaround times from the execution log."""
+        processes = self.workload.processes
+        # Segments are in time order, so a process's last segment ends at its finish time
+        for index, start, end in self.timeline:
+            self.finish_time[index] = end
+        for i in range(len(processes)):
+            self.turn_around_time[i] = self.finish_time[i] - processes[i][1]
+            self.norm_turn[i] = float(self.turn_around_time[i]) / processes[i][2]
+    
+    def timeline_rows(self):
+        """Yield each process's trace row, rendered from the execution log one row at a time."""
+        processes = self.workload.processes
+        last_instant = self.workload.last_instant
+        runs = [[] for _ in processes]
+        for index, start, end in self.timeline:
+            runs[index].append((start, end))
+        
+        for i in range(len(processes)):
+            cells = []
+            position = 0
+            for start, end in runs[i]:
+                start = min(start, last_instant)
+                end = min(end, last_instant)
+                cells.append(" |" * (start - position))
+                cells.append("*|" * (end - start))
+                position = end
+            cells.append(" |" * (last_instant - position))
+            yield f"{processes[i][0]}     |" + "".join(cells) + " "
     
-    while processed_count < process_count:
-        # Add arriving processes to ready queue
+    def first_come_first_serve(self):
+        """Implement First Come First Serve scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        current_time = 0
         for i in range(process_count):
-            if processes[i][1] == current_time:
-                ready_queue.append(i)
+            arrival = processes[i][1]
+            service = processes[i][2]
+            current_time = max(current_time, arrival)
+            
+            self.run_process(i, current_time, current_time + service)
+            current_time += service
+
+    def round_robin(self, quantum):
+        """Implement Round Robin scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        remaining_service_time = [processes[i][2] for i in range(process_count)]
+        arrivals = Arrivals(processes)
+        ready_queue = deque()
+        current_time = 0
+        processed_count = 0
         
-        if ready_queue:
-            index = ready_queue.popleft()
-            execution_time = min(quantum, remaining_service_time[index])
+        while processed_count < process_count:
+            # Add arrived processes to ready queue
+            ready_queue.extend(arrivals.admit(current_time))
             
-            for j in range(execution_time):
-                timeline[current_time][index] = '*'
-                current_time += 1
+            if not ready_queue:
+                # CPU idle: jump to the next arrival
+                current_time = arrivals.next_time()
+                continue
             
+            index = ready_queue.popleft()
+            execution_time = min(quantum, remaining_service_time[index])
+            self.run_process(index, current_time, current_time + execution_time)
+            current_time += execution_time
             remaining_service_time[index] -= execution_time
             
             if remaining_service_time[index] > 0:
+                # Processes that arrived while it ran queue up ahead of it
+                ready_queue.extend(arrivals.admit(current_time - 1))
                 ready_queue.append(index)
             else:
-                finish_time[index] = current_time
-                turn_around_time[index] = finish_time[index] - processes[index][1]
-                norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
                 processed_count += 1
-        else:
-            current_time += 1
 
-def shortest_process_next():
-    """Implement Shortest Process Next scheduling algorithm."""
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    current_time = 0
-    processed_count = 0
-    
-    while processed_count < process_count:
-        min_service_time = float('inf')
-        index = -1
-        
-        for i in range(process_count):
-            if (processes[i][1] <= current_time and 
-                remaining_service_time[i] > 0 and 
-                remaining_service_time[i] < min_service_time):
-                min_service_time = remaining_service_time[i]
-                index = i
+    def shortest_process_next(self):
+        """Implement Shortest Process Next scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        arrivals = Arrivals(processes)
+        ready = []      # Min-heap of (service time, index)
+        current_time = 0
+        processed_count = 0
         
-        if index != -1:
-            for j in range(remaining_service_time[index]):
-                timeline[current_time][index] = '*'
-                current_time += 1
+        while processed_count < process_count:
+            for i in arrivals.admit(current_time):
+                heapq.heappush(ready, (processes[i][2], i))
             
-            finish_time[index] = current_time
-            turn_around_time[index] = finish_time[index] - processes[index][1]
-            norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
-            remaining_service_time[index] = 0
+            if not ready:
+                current_time = arrivals.next_time()
+                continue
+            
+            # Shortest service time, earliest index on ties
+            service, index = heapq.heappop(ready)
+            self.run_process(index, current_time, current_time + service)
+            current_time += service
             processed_count += 1
-        else:
-            current_time += 1
 
-def shortest_remaining_time():
-    """Implement Shortest Remaining Time scheduling algorithm."""
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    current_time = 0
-    processed_count = 0
-    
-    while processed_count < process_count:
-        min_service_time = float('inf')
-        index = -1
+    def shortest_remaining_time(self):
+        """Implement Shortest Remaining Time scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        arrivals = Arrivals(processes)
+        ready = []      # Min-heap of (remaining service time, index)
+        current_time = 0
+        processed_count = 0
         
-        for i in range(process_count):
-            if (processes[i][1] <= current_time and 
-                remaining_service_time[i] > 0 and 
-                remaining_service_time[i] < min_service_time):
-                min_service_time = remaining_service_time[i]
-                index = i
-        
-        if index != -1:
-            timeline[current_time][index] = '*'
-            current_time += 1
-            remaining_service_time[index] -= 1
+        while processed_count < process_count:
+            for i in arrivals.admit(current_time):
+                heapq.heappush(ready, (processes[i][2], i))
             
-            if remaining_service_time[index] == 0:
-                finish_time[index] = current_time
-                turn_around_time[index] = finish_time[index] - processes[index][1]
-                norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
+            if not ready:
+                current_time = arrivals.next_time()
+                continue
+            
+            remaining, index = heapq.heappop(ready)
+            # The choice can only change when a new process arrives, so run until then or completion
+            end = current_time + remaining
+            next_arrival = arrivals.next_time()
+            if next_arrival is not None and next_arrival < end:
+                end = next_arrival
+            self.run_process(index, current_time, end)
+            remaining -= end - current_time
+            current_time = end
+            
+            if remaining == 0:
                 processed_count += 1
-        else:
-            current_time += 1
+            else:
+                heapq.heappush(ready, (remaining, index))
 
-def highest_response_ratio_next():
-    """Implement Highest Response Ratio Next scheduling algorithm."""
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    current_time = 0
-    processed_count = 0
-    
-    while processed_count < process_count:
-        max_response_ratio = -1
-        index = -1
+    def highest_response_ratio_next(self):
+        """Implement Highest Response Ratio Next scheduling algorithm.
+
+        The response ratio (waiting + service) / service grows at a different rate
+        for each service time, so no single heap order stays valid. Among processes
+        with the same service time, though, the earliest arrival always has the
+        highest ratio, so ready processes are kept in one (arrival, index) heap per
+        service time and only the head of each heap is compared.
+        """
+        processes = self.workload.processes
+        process_count = len(processes)
+        arrivals = Arrivals(processes)
+        ready = {}      # service time -> min-heap of (arrival, index)
+        current_time = 0
+        processed_count = 0
         
-        for i in range(process_count):
-            if processes[i][1] <= current_time and remaining_service_time[i] > 0:
-                response_ratio = float(current_time - processes[i][1] + remaining_service_time[i]) / remaining_service_time[i]
-                if response_ratio > max_response_ratio:
+        while processed_count < process_count:
+            for i in arrivals.admit(current_time):
+                heapq.heappush(ready.setdefault(processes[i][2], []), (processes[i][1], i))
+            
+            if not ready:
+                current_time = arrivals.next_time()
+                continue
+            
+            max_response_ratio = -1
+            index = -1
+            for service, queue in ready.items():
+                arrival, i = queue[0]
+                response_ratio = float(current_time - arrival + service) / service
+                if response_ratio > max_response_ratio or (response_ratio == max_response_ratio and i < index):
                     max_response_ratio = response_ratio
                     index = i
-        
-        if index != -1:
-            for j in range(remaining_service_time[index]):
-                timeline[current_time][index] = '*'
-                current_time += 1
             
-            finish_time[index] = current_time
-            turn_around_time[index] = finish_time[index] - processes[index][1]
-            norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
-            remaining_service_time[index] = 0
+            service = processes[index][2]
+            heapq.heappop(ready[service])
+            if not ready[service]:
+                del ready[service]
+            self.run_process(index, current_time, current_time + service)
+            current_time += service
             processed_count += 1
-        else:
-            current_time += 1
 
-def feedback_q1():
-    """Implement Feedback Queue with quantum 1 scheduling algorithm."""
-    ready_queue = deque()
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    current_time = 0
-    processed_count = 0
-    
-    while processed_count < process_count:
-        # Add arriving processes to ready queue
-        for i in range(process_count):
-            if processes[i][1] == current_time:
-                ready_queue.append(i)
+    def feedback_q1(self):
+        """Implement Feedback Queue with quantum 1 scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        remaining_service_time = [processes[i][2] for i in range(process_count)]
+        arrivals = Arrivals(processes)
+        ready_queue = deque()
+        current_time = 0
+        processed_count = 0
         
-        if ready_queue:
+        while processed_count < process_count:
+            # Add arrived processes to ready queue
+            ready_queue.extend(arrivals.admit(current_time))
+            
+            if not ready_queue:
+                current_time = arrivals.next_time()
+                continue
+            
             index = ready_queue.popleft()
-            timeline[current_time][index] = '*'
+            self.run_process(index, current_time, current_time + 1)
             current_time += 1
             remaining_service_time[index] -= 1
             
             if remaining_service_time[index] > 0:
                 ready_queue.append(index)
             else:
-                finish_time[index] = current_time
-                turn_around_time[index] = finish_time[index] - processes[index][1]
-                norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
                 processed_count += 1
-        else:
-            current_time += 1
 
-def feedback_q2i():
-    """Implement Feedback Queue with increasing quantum scheduling algorithm."""
-    ready_queues = [deque() for _ in range(32)]
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    current_time = 0
-    processed_count = 0
-    quantum = 1
-    
-    while processed_count < process_count:
-        # Add arriving processes to first queue
-        for i in range(process_count):
-            if processes[i][1] == current_time:
-                ready_queues[0].append(i)
-        
-        # Find first non-empty queue
-        queue_level = -1
-        for i in range(32):
-            if ready_queues[i]:
-                queue_level = i
-                break
+    def feedback_q2i(self):
+        """Implement Feedback Queue with increasing quantum scheduling algorithm."""
+        processes = self.workload.processes
+        process_count = len(processes)
+        ready_queues = [deque() for _ in range(32)]
+        remaining_service_time = [processes[i][2] for i in range(process_count)]
+        arrivals = Arrivals(processes)
+        current_time = 0
+        processed_count = 0
+        quantum = 1
         
-        if queue_level != -1:
-            index = ready_queues[queue_level].popleft()
-            execution_time = min(quantum, remaining_service_time[index])
+        while processed_count < process_count:
+            # Add arrived processes to first queue
+            ready_queues[0].extend(arrivals.admit(current_time))
             
-            for j in range(execution_time):
-                timeline[current_time][index] = '*'
-                current_time += 1
+            # Find first non-empty queue
+            queue_level = -1
+            for i in range(32):
+                if ready_queues[i]:
+                    queue_level = i
+                    break
             
+            if queue_level == -1:
+                current_time = arrivals.next_time()
+                continue
+            
+            index = ready_queues[queue_level].popleft()
+            execution_time = min(quantum, remaining_service_time[index])
+            self.run_process(index, current_time, current_time + execution_time)
+            current_time += execution_time
             remaining_service_time[index] -= execution_time
             
             if remaining_service_time[index] > 0:
@@ -313,103 +401,103 @@ def feedback_q2i():
                 else:
                     ready_queues[queue_level].append(index)
             else:
-                finish_time[index] = current_time
-                turn_around_time[index] = finish_time[index] - processes[index][1]
-                norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
                 processed_count += 1
             
             quantum = 1 << (queue_level + 1)
-        else:
-            current_time += 1
 
-def aging(quantum):
-    """Implement Aging scheduling algorithm."""
-    remaining_service_time = [processes[i][2] for i in range(process_count)]
-    priority = [0] * process_count
-    current_time = 0
-    processed_count = 0
-    
-    while processed_count < process_count:
-        max_priority = float('-inf')
-        index = -1
-        
-        for i in range(process_count):
-            if (processes[i][1] <= current_time and 
-                remaining_service_time[i] > 0 and 
-                priority[i] > max_priority):
-                max_priority = priority[i]
-                index = i
+    def aging(self, quantum):
+        """Implement Aging scheduling algorithm.
+
+        Every waiting process (the running one included) gains one priority point
+        per scheduling round, so a process's priority is the number of rounds since
+        it arrived. The highest priority is therefore the earliest admission round,
+        and ready processes sit in a min-heap of (admission round, index).
+        """
+        processes = self.workload.processes
+        process_count = len(processes)
+        remaining_service_time = [processes[i][2] for i in range(process_count)]
+        arrivals = Arrivals(processes)
+        ready = []      # Min-heap of (admission round, index)
+        rounds = 0      # Aging rounds so far
+        current_time = 0
+        processed_count = 0
         
-        if index != -1:
-            execution_time = min(quantum, remaining_service_time[index])
-            for j in range(execution_time):
-                timeline[current_time][index] = '*'
-                current_time += 1
+        while processed_count < process_count:
+            for i in arrivals.admit(current_time):
+                heapq.heappush(ready, (rounds, i))
             
-            remaining_service_time[index] -= execution_time
+            if ready:
+                # Highest priority, earliest index on ties
+                index = ready[0][1]
+                execution_time = min(quantum, remaining_service_time[index])
+                self.run_process(index, current_time, current_time + execution_time)
+                current_time += execution_time
+                remaining_service_time[index] -= execution_time
+                
+                if remaining_service_time[index] <= 0:
+                    heapq.heappop(ready)
+                    processed_count += 1
+            else:
+                current_time = arrivals.next_time()
             
-            if remaining_service_time[index] <= 0:
-                finish_time[index] = current_time
-                turn_around_time[index] = finish_time[index] - processes[index][1]
-                norm_turn[index] = float(turn_around_time[index]) / processes[index][2]
-                processed_count += 1
-        else:
-            current_time += 1
-        
-        # Age all waiting processes
-        for i in range(process_count):
-            if processes[i][1] <= current_time and remaining_service_time[i] > 0:
-                priority[i] += 1
+            # Age all waiting processes: admit new arrivals, then one more round passes for everyone
+            for i in arrivals.admit(current_time):
+                heapq.heappush(ready, (rounds, i))
+            rounds += 1
 
-def execute_algorithm(algorithm_id, quantum, operation):
-    """Execute the specified scheduling algorithm."""
-    if algorithm_id == '1':
-        if operation == TRACE:
-            print("FCFS  ", end="")
-        first_come_first_serve()
-    elif algorithm_id == '2':
-        if operation == TRACE:
-            print(f"RR-{quantum}  ", end="")
-        round_robin(quantum)
-    elif algorithm_id == '3':
-        if operation == TRACE:
-            print("SPN   ", end="")
-        shortest_process_next()
-    elif algorithm_id == '4':
-        if operation == TRACE:
-            print("SRT   ", end="")
-        shortest_remaining_time()
-    elif algorithm_id == '5':
-        if operation == TRACE:
-            print("HRRN  ", end="")
-        highest_response_ratio_next()
-    elif algorithm_id == '6':
-        if operation == TRACE:
-            print("FB-1  ", end="")
-        feedback_q1()
-    elif algorithm_id == '7':
-        if operation == TRACE:
-            print("FB-2i ", end="")
-        feedback_q2i()
-    elif algorithm_id == '8':
-        if operation == TRACE:
-            print("Aging ", end="")
-        aging(quantum)
+def print_finish_time(scheduler):
+    """Print finish times for all processes."""
+    processes = scheduler.workload.processes
+    for i in range(len(processes)):
+        print(f"Process {processes[i][0]} finished at time {scheduler.finish_time[i]}")
+
+def print_turn_around_time(scheduler):
+    """Print turnaround times for all processes."""
+    processes = scheduler.workload.processes
+    for i in range(len(processes)):
+        print(f"Process {processes[i][0]} turnaround time is {scheduler.turn_around_time[i]}")
+
+def print_norm_turn(scheduler):
+    """Print normalized turnaround times for all processes."""
+    processes = scheduler.workload.processes
+    for i in range(len(processes)):
+        print(f"Process {processes[i][0]} normalized turnaround time is {scheduler.norm_turn[i]}")
+
+def print_timeline(scheduler):
+    """Print the execution timeline."""
+    # Print time header
+    for i in range(scheduler.workload.last_instant + 1):
+        print(i % 10, end=" ")
+    print()
+    print("-" * 48)
+    
+    # Print process timelines
+    for row in scheduler.timeline_rows():
+        print(row)
+    print("-" * 48)
+
+def print_stats(scheduler):
+    """Print statistics for the algorithm."""
+    print_finish_time(scheduler)
+    print_turn_around_time(scheduler)
+    print_norm_turn(scheduler)
 
 def main():
     """Main function to run the scheduler simulator."""
-    parse()
+    operation, algorithms, workload = parse()
+    scheduler = Scheduler(workload)
     
-    for idx, (algorithm_id, quantum) in enumerate(algorithms):
-        clear_timeline()
-        execute_algorithm(algorithm_id, quantum, operation)
+    for algorithm_id, quantum in algorithms:
+        if operation == TRACE:
+            print(algorithm_label(algorithm_id, quantum), end="")
+        scheduler.run(algorithm_id, quantum)
         
         if operation == TRACE:
-            print_timeline(idx)
+            print_timeline(scheduler)
         elif operation == SHOW_STATISTICS:
-            print_stats(idx)
+            print_stats(scheduler)
         
         print()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
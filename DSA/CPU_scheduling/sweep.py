@@ -0,0 +1,91 @@
+import argparse
+import csv
+import glob
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from d_u import Scheduler, algorithm_label, read_workload
+
+# Algorithms that take a quantum (RR and Aging); the others run once per workload
+QUANTUM_ALGORITHMS = {'2', '8'}
+
+# Each worker keeps its most recent workloads; jobs are ordered by workload so this hits
+cached_workload = lru_cache(maxsize=64)(read_workload)
+
+# Worker: run one (workload, algorithm, quantum) job and return its per-process results as raw arrays
+def run_job(job):
+    path, algorithm_id, quantum = job
+    scheduler = Scheduler(cached_workload(path))
+    finish_time, turn_around_time, norm_turn = scheduler.run(algorithm_id, quantum)
+    return algorithm_id, quantum, turn_around_time.tobytes(), norm_turn.tobytes()
+
+# Generator of every (workload, algorithm, quantum) job
+def sweep_jobs(paths, algorithm_ids, quanta):
+    for path in paths:
+        for algorithm_id in algorithm_ids:
+            for quantum in (quanta if algorithm_id in QUANTUM_ALGORITHMS else [-1]):
+                yield path, algorithm_id, quantum
+
+# Function to get the p-th percentile of a sequence of numbers
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+# Function to run the sweep on a process pool and write one CSV row per (algorithm, quantum)
+def run_sweep(paths, algorithm_ids, quanta, output_path, workers=None, chunk_size=16):
+    start = time.perf_counter()
+    results = {}    # (algorithm_id, quantum) -> [workloads, turnaround times, normalized turnaround times]
+    jobs = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for algorithm_id, quantum, turn_around, norm_turn in executor.map(
+                run_job, sweep_jobs(paths, algorithm_ids, quanta), chunksize=chunk_size):
+            entry = results.setdefault((algorithm_id, quantum), [0, array('q'), array('d')])
+            entry[0] += 1
+            entry[1].frombytes(turn_around)
+            entry[2].frombytes(norm_turn)
+            jobs += 1
+
+    with open(output_path, 'w', newline='') as output_file:
+        writer = csv.writer(output_file)
+        writer.writerow(['algorithm', 'quantum', 'workloads', 'processes', 'mean_turnaround',
+                         'p95_turnaround', 'mean_norm_turnaround', 'p95_norm_turnaround'])
+        for (algorithm_id, quantum), (workloads, turn_around, norm_turn) in sorted(results.items()):
+            label = algorithm_label(algorithm_id, quantum).strip()
+            if algorithm_id == '8':
+                label += f"-{quantum}"
+            count = len(turn_around)
+            writer.writerow([label, quantum if quantum != -1 else '', workloads, count,
+                             f"{sum(turn_around) / count:.4f}" if count else '',
+                             percentile(turn_around, 95),
+                             f"{sum(norm_turn) / count:.4f}" if count else '',
+                             f"{percentile(norm_turn, 95):.4f}"])
+
+    elapsed = time.perf_counter() - start
+    rate = jobs / elapsed if elapsed > 0 else float('inf')
+    print(f"Ran {jobs} simulation(s) over {len(paths)} workload(s) in {elapsed:.2f}s ({rate:,.0f} simulations/s)")
+    print(f"Results written to {output_path}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep CPU scheduling algorithms and quanta over many workloads")
+    parser.add_argument("workloads", nargs="+",
+                        help="workload files or glob patterns (d_u.py input format, header line optional)")
+    parser.add_argument("--algorithms", default="1,2,3,4,5,6,7,8",
+                        help="comma-separated algorithm ids (1=FCFS 2=RR 3=SPN 4=SRT 5=HRRN 6=FB-1 7=FB-2i 8=Aging)")
+    parser.add_argument("--quanta", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="quanta tried for RR and Aging")
+    parser.add_argument("--output", default="sweep.csv")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="jobs sent to a worker at a time")
+    args = parser.parse_args()
+
+    paths = sorted({path for pattern in args.workloads for path in (glob.glob(pattern) or [pattern])})
+    algorithm_ids = [algorithm_id.strip() for algorithm_id in args.algorithms.split(',') if algorithm_id.strip()]
+    run_sweep(paths, algorithm_ids, args.quanta, args.output, args.workers, args.chunk_size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import random
+
+from d_u import Workload
+
+SERVICE_DISTRIBUTIONS = ("exponential", "pareto", "bimodal")
+PARETO_SHAPE = 1.5          # Heavy tail with a finite mean (infinite variance)
+BIMODAL_LONG_SHARE = 0.1    # Share of long jobs in the bimodal mix
+BIMODAL_RATIO = 10          # Long jobs are this many times longer than short ones
+
+# Function to draw one integer service time (at least 1) with the given mean
+def service_time(rng, distribution, mean_service):
+    if distribution == "exponential":
+        value = rng.expovariate(1 / mean_service)
+    elif distribution == "pareto":
+        # paretovariate has minimum 1 and mean shape / (shape - 1); rescale to the requested mean
+        value = mean_service * (PARETO_SHAPE - 1) / PARETO_SHAPE * rng.paretovariate(PARETO_SHAPE)
+    elif distribution == "bimodal":
+        short = mean_service / (1 - BIMODAL_LONG_SHARE + BIMODAL_LONG_SHARE * BIMODAL_RATIO)
+        mode = short * BIMODAL_RATIO if rng.random() < BIMODAL_LONG_SHARE else short
+        value = rng.gauss(mode, mode / 4)
+    else:
+        raise ValueError(f"unknown service distribution: {distribution!r}")
+    return max(1, round(value))
+
+# Function to generate a workload with Poisson arrivals.
+# load is the arrival rate times the mean service time (CPU utilization; above 1 the queue keeps growing).
+def generate_workload(num_processes, service="exponential", mean_service=10.0, load=0.9, seed=0):
+    rng = random.Random(seed)
+    arrival_rate = load / mean_service
+    processes = []
+    arrival = 0.0
+    total_service = 0
+    for i in range(num_processes):
+        duration = service_time(rng, service, mean_service)
+        processes.append((f"P{i}", int(arrival), duration))
+        total_service += duration
+        # Poisson process: exponential gaps between arrivals
+        arrival += rng.expovariate(arrival_rate)
+    # Every process has finished by the last arrival plus all the work
+    last_instant = (processes[-1][1] if processes else 0) + total_service
+    return Workload(processes, last_instant)
+
+# Function to write a workload in the d_u.py input format
+def write_workload(workload, path, operation="stats", algorithms="1"):
+    with open(path, 'w') as workload_file:
+        workload_file.write(f"{operation} {algorithms} {workload.last_instant} {workload.process_count}\n")
+        workload_file.writelines(f"{name},{arrival},{service}\n" for name, arrival, service in workload.processes)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic CPU scheduling workloads")
+    parser.add_argument("--count", type=int, default=1, help="number of workload files")
+    parser.add_argument("--processes", type=int, default=100, help="processes per workload")
+    parser.add_argument("--service", choices=SERVICE_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-service", type=float, default=10.0)
+    parser.add_argument("--load", type=float, default=0.9, help="arrival rate x mean service time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", default="workloads")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for i in range(args.count):
+        workload = generate_workload(args.processes, args.service, args.mean_service, args.load, args.seed + i)
+        write_workload(workload, os.path.join(args.output_dir, f"workload_{i:05d}.txt"))
+    print(f"Wrote {args.count} workload(s) of {args.processes} processes to {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
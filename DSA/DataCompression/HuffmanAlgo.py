@@ -2,6 +2,8 @@ import heapq
 from collections import defaultdict
 import sys
 import os
+import json
+import hashlib
 
 # Node class for Huffman Tree
 class Node:
@@ -36,6 +38,32 @@ class Node:
 def create_node(char, freq, left=None, right=None):
     return Node(char, freq, left, right)
 
+# Function to build the Huffman tree from a frequency map and return its root
+def build_tree(frequency_map):
+    # Priority queue to store nodes of Huffman Tree
+    priority_queue = []
+    
+    # Create leaf nodes and add them to priority queue
+    for char, freq in frequency_map.items():
+        node = create_node(char, freq)
+        heapq.heappush(priority_queue, node)
+    
+    # Build Huffman Tree by combining nodes (a single node is already the root)
+    while len(priority_queue) > 1:
+        # Pop two nodes with minimum frequency
+        left = heapq.heappop(priority_queue)
+        right = heapq.heappop(priority_queue)
+        
+        # Create new internal node with combined frequency
+        combined_freq = left.freq + right.freq
+        merged_node = create_node(None, combined_freq, left, right)
+        
+        # Push back to priority queue
+        heapq.heappush(priority_queue, merged_node)
+    
+    # Root of the Huffman tree
+    return priority_queue[0]
+
 # Function to encode characters and generate Huffman codes
 def encode(root, code, huffman_codes):
     if root is None:
@@ -107,34 +135,10 @@ def huffman(input_text):
     
     print(f"Character frequencies: {dict(frequency_map)}")
     
-    # Priority queue to store nodes of Huffman Tree
-    priority_queue = []
-    
-    # Create leaf nodes and add them to priority queue
-    for char, freq in frequency_map.items():
-        node = create_node(char, freq)
-        heapq.heappush(priority_queue, node)
-    
-    # Handle single character case
-    if len(priority_queue) == 1:
-        root = priority_queue[0]
+    # Build the Huffman tree from the frequencies
+    root = build_tree(frequency_map)
+    if root.left is None and root.right is None:
         print("Single character detected - using special handling")
-    else:
-        # Build Huffman Tree by combining nodes
-        while len(priority_queue) > 1:
-            # Pop two nodes with minimum frequency
-            left = heapq.heappop(priority_queue)
-            right = heapq.heappop(priority_queue)
-            
-            # Create new internal node with combined frequency
-            combined_freq = left.freq + right.freq
-            merged_node = create_node(None, combined_freq, left, right)
-            
-            # Push back to priority queue
-            heapq.heappush(priority_queue, merged_node)
-        
-        # Root of the Huffman tree
-        root = priority_queue[0]
     
     # Generate Huffman codes
     huffman_codes = {}
@@ -230,6 +234,153 @@ def huffman(input_text):
     
     return True
 
+# ---------------------------------------------------------------------------
+# Static dictionary mode
+# ---------------------------------------------------------------------------
+# For many small, similar payloads the per-message tree build and code header
+# cost more than the payload itself. In static mode a code table is trained
+# once over a sample, saved to disk, and every payload is then encoded with it
+# without a header. Two reserved symbols are added to every trained table:
+#   - ESCAPE_SYMBOL is followed by a raw 21-bit code point, so characters that
+#     never appeared in the sample can still be encoded
+#   - EOF_SYMBOL marks the end of a payload, so the zero padding of the last
+#     byte is never decoded as data
+# Reserved symbols are multi-character strings, so they never clash with a
+# real (single) character.
+
+EOF_SYMBOL = "EOF"
+ESCAPE_SYMBOL = "ESC"
+ESCAPE_BITS = 21            # Enough for any Unicode code point (max 0x10FFFF)
+DECODE_LOOKUP_BITS = 12     # Width of the direct decode lookup table
+
+# In-process cache of compiled tables keyed by table hash
+_compiled_tables = {}
+
+class StaticCodeTable:
+    def __init__(self, codes, table_hash):
+        self.codes = codes                  # Symbol -> code string
+        self.table_hash = table_hash        # Hash of the canonical table
+        self.eof_code = codes[EOF_SYMBOL]
+        self.escape_code = codes[ESCAPE_SYMBOL]
+        self.code_to_symbol = {code: symbol for symbol, code in codes.items()}
+        
+        # Direct lookup table: the next DECODE_LOOKUP_BITS bits (as an int) map
+        # to (symbol, code length). Longer codes fall back to code_to_symbol.
+        self.lookup_bits = min(DECODE_LOOKUP_BITS, max(len(code) for code in codes.values()))
+        self.lookup = [None] * (1 << self.lookup_bits)
+        for symbol, code in codes.items():
+            if len(code) <= self.lookup_bits:
+                free_bits = self.lookup_bits - len(code)
+                first = int(code, 2) << free_bits
+                for i in range(first, first + (1 << free_bits)):
+                    self.lookup[i] = (symbol, len(code))
+    
+    # Encode a payload into bytes using this table (no header)
+    def encode(self, payload):
+        codes = self.codes
+        bits = []
+        for char in payload:
+            code = codes.get(char)
+            if code is None:
+                # Character not seen during training: escape + raw code point
+                code = self.escape_code + format(ord(char), f"0{ESCAPE_BITS}b")
+            bits.append(code)
+        bits.append(self.eof_code)
+        bit_string = ''.join(bits)
+        
+        # Pad with zeros up to a whole number of bytes
+        padding = -len(bit_string) % 8
+        bit_string += "0" * padding
+        return int(bit_string, 2).to_bytes(len(bit_string) // 8, "big")
+    
+    # Decode bytes produced by encode() with the same table
+    def decode(self, data):
+        if not data:
+            return ""
+        
+        bit_string = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b")
+        total_bits = len(bit_string)
+        lookup = self.lookup
+        lookup_bits = self.lookup_bits
+        decoded_chars = []
+        pos = 0
+        
+        while pos < total_bits:
+            window = bit_string[pos:pos + lookup_bits]
+            entry = lookup[int(window.ljust(lookup_bits, "0"), 2)]
+            if entry is not None and entry[1] <= total_bits - pos:
+                symbol, length = entry
+            else:
+                symbol, length = self._decode_long(bit_string, pos)
+            pos += length
+            
+            if symbol == EOF_SYMBOL:
+                return ''.join(decoded_chars)
+            if symbol == ESCAPE_SYMBOL:
+                decoded_chars.append(chr(int(bit_string[pos:pos + ESCAPE_BITS], 2)))
+                pos += ESCAPE_BITS
+            else:
+                decoded_chars.append(symbol)
+        
+        raise ValueError("Payload ended without an end-of-payload code")
+    
+    # Slow path for codes longer than the lookup width
+    def _decode_long(self, bit_string, pos):
+        end = pos + self.lookup_bits
+        while end <= len(bit_string):
+            symbol = self.code_to_symbol.get(bit_string[pos:end])
+            if symbol is not None:
+                return symbol, end - pos
+            end += 1
+        raise ValueError(f"Invalid code at bit {pos}")
+
+# Function to compute a stable hash of a code table
+def code_table_hash(codes):
+    canonical = json.dumps(sorted(codes.items()), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+# Function to get the compiled encode/decode tables, reusing cached ones
+def compile_code_table(codes):
+    table_hash = code_table_hash(codes)
+    table = _compiled_tables.get(table_hash)
+    if table is None:
+        table = StaticCodeTable(dict(codes), table_hash)
+        _compiled_tables[table_hash] = table
+    return table
+
+# Function to train a static code table over a sample of payloads
+def train_code_table(samples):
+    frequency_map = defaultdict(int)
+    for sample in samples:
+        for char in sample:
+            frequency_map[char] += 1
+    
+    # Reserved symbols always get a code
+    frequency_map[EOF_SYMBOL] += 1
+    frequency_map[ESCAPE_SYMBOL] += 1
+    
+    codes = {}
+    encode(build_tree(frequency_map), "", codes)
+    return compile_code_table(codes)
+
+# Function to persist a trained code table
+def save_code_table(table, path):
+    with open(path, "w", encoding='utf-8') as table_file:
+        json.dump({"hash": table.table_hash, "codes": table.codes}, table_file, ensure_ascii=False)
+
+# Function to load a persisted code table (compiled tables are cached by hash)
+def load_code_table(path):
+    with open(path, "r", encoding='utf-8') as table_file:
+        stored = json.load(table_file)
+    
+    codes = stored["codes"]
+    if EOF_SYMBOL not in codes or ESCAPE_SYMBOL not in codes:
+        raise ValueError(f"'{path}' is not a static Huffman code table")
+    table = compile_code_table(codes)
+    if stored.get("hash", table.table_hash) != table.table_hash:
+        raise ValueError(f"Code table '{path}' does not match its stored hash")
+    return table
+
 # Main function
 def main():
     print("="*50)
@@ -1,15 +1,154 @@
+import argparse
+import csv
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class Expense:
     def __init__(self, payer, category, amount, participants):
         self.payer = payer
         self.category = category
         self.amount = amount
         self.participants = participants
+        self.row_id = None      # Row in the group store, once saved
 
 class Transfer:
     def __init__(self, from_person, to_person, amount):
         self.from_person = from_person
         self.to_person = to_person
         self.amount = amount
+        self.row_id = None      # Row in the group store, once saved
+
+# Greedy settlement: repeatedly the biggest debtor pays the biggest creditor
+# as much as possible, until all net amounts are within tolerance of zero.
+# Creditors and debtors are kept in two heaps, so each payment costs O(log n)
+# instead of a full scan, and the loop is iterative (no recursion limit).
+# Ties go to the lowest index. Returns (debtor, creditor, amount) tuples.
+def greedy_settlement(amount, tolerance=0.01):
+    creditors = [(-net, i) for i, net in enumerate(amount) if net > tolerance]
+    debtors = [(net, i) for i, net in enumerate(amount) if net < -tolerance]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+    
+    payments = []
+    while creditors and debtors:
+        credit, creditor = heapq.heappop(creditors)
+        debit, debtor = heapq.heappop(debtors)
+        credit = -credit
+        
+        # Calculate minimum transfer amount
+        minimum = min(-debit, credit)
+        payments.append((debtor, creditor, minimum))
+        
+        # Whoever is not fully settled goes back into their heap
+        if credit - minimum > tolerance:
+            heapq.heappush(creditors, (-(credit - minimum), creditor))
+        if debit + minimum < -tolerance:
+            heapq.heappush(debtors, (debit + minimum, debtor))
+    return payments
+
+# Largest number of people (after pairing exact opposites) solved exactly;
+# bigger groups fall back to the greedy, as the search is O(2^n * n)
+OPTIMAL_MAX_PEOPLE = 16
+
+# converts net amounts to integer cents that sum exactly to zero
+def to_cents(amount):
+    cents = [round(net * 100) for net in amount]
+    if cents:
+        # Rounding leftovers (e.g. from splitting 100 three ways) go to the largest position
+        largest = max(range(len(cents)), key=lambda i: abs(cents[i]))
+        cents[largest] -= sum(cents)
+    return cents
+
+# splits values into the largest number of zero-sum groups (bitmask DP).
+# best[mask] is the most zero-sum groups the people in mask can be cut into.
+# Returns lists of positions into values.
+def max_zero_sum_groups(values):
+    n = len(values)
+    full = (1 << n) - 1
+    total = [0] * (full + 1)
+    best = [0] * (full + 1)
+    for mask in range(1, full + 1):
+        low = mask & -mask
+        total[mask] = total[mask ^ low] + values[low.bit_length() - 1]
+        most = 0
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            if best[mask ^ bit] > most:
+                most = best[mask ^ bit]
+            rest ^= bit
+        best[mask] = most + (total[mask] == 0)
+    
+    # Walk back from the full set to recover an order whose prefix sums hit zero best[full] times
+    order = []
+    mask = full
+    while mask:
+        need = best[mask] - (total[mask] == 0)
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            if best[mask ^ bit] == need:
+                break
+            rest ^= bit
+        order.append(bit.bit_length() - 1)
+        mask ^= bit
+    order.reverse()
+    
+    # Cut the order wherever the running sum returns to zero
+    groups, group, running = [], [], 0
+    for i in order:
+        group.append(i)
+        running += values[i]
+        if running == 0:
+            groups.append(group)
+            group = []
+    return groups
+
+# Optimal settlement: the fewest payments that settle everyone. A zero-sum
+# group of k people needs k - 1 payments, so the answer is (people with a
+# balance) - (most zero-sum groups they split into). Exact opposite pairs are
+# always such a group and are matched first; the rest is solved with
+# max_zero_sum_groups, or greedily if more than max_people remain.
+# Works on integer cents. Returns (debtor, creditor, amount) tuples.
+def optimal_settlement(amount, max_people=OPTIMAL_MAX_PEOPLE):
+    cents = to_cents(amount)
+    
+    groups = []
+    unmatched = {}      # cents value -> people waiting for an exact opposite
+    for i, value in enumerate(cents):
+        if value == 0:
+            continue
+        partners = unmatched.get(-value)
+        if partners:
+            groups.append([partners.pop(), i])
+        else:
+            unmatched.setdefault(value, []).append(i)
+    rest = sorted(i for people in unmatched.values() for i in people)
+    
+    if len(rest) > max_people:
+        groups.append(rest)
+    elif rest:
+        for group in max_zero_sum_groups([cents[i] for i in rest]):
+            groups.append([rest[i] for i in group])
+    
+    # Within a zero-sum group the greedy needs at most k - 1 payments
+    payments = []
+    for group in groups:
+        for debtor, creditor, paid in greedy_settlement([cents[i] for i in group], tolerance=0):
+            payments.append((group[debtor], group[creditor], paid / 100))
+    return payments
 
 class Group:
     def __init__(self, group_name, number_of_persons, people_dict):
@@ -18,73 +157,49 @@ class Group:
         self.people_dict = people_dict
         self.expense_history = []
         self.transfer_history = []
-        # Initialize graph as 2D array with zeros
-        self.graph = [[0.0 for _ in range(number_of_persons)] for _ in range(number_of_persons)]
+        # Reverse index: person index -> name
+        self.index_to_name = [""] * number_of_persons
+        for name, idx in people_dict.items():
+            self.index_to_name[idx] = name
+        # Net amount per person (owed to them minus what they owe), kept up
+        # to date on every expense/transfer change; settling only needs these
+        self.net = [0.0] * number_of_persons
     
     def line(self, n):
         print("-" * n)
     
-    # finds the person who owes the most money
-    def get_minimum_index(self, amount_array):
-        min_index = 0
-        for i in range(1, self.number_of_persons):
-            if amount_array[i] < amount_array[min_index]:
-                min_index = i
-        return min_index
-    
-    # finds the person who is owed the most money in the group.
-    def get_maximum_index(self, amount_array):
-        max_index = 0
-        for i in range(1, self.number_of_persons):
-            if amount_array[i] > amount_array[max_index]:
-                max_index = i
-        return max_index
-    
-    def minimum_of_two(self, num1, num2):
-        return min(num1, num2)
-    
     def find_name_for_index(self, index):
-        for name, idx in self.people_dict.items():
-            if idx == index:
-                return name
+        if 0 <= index < len(self.index_to_name):
+            return self.index_to_name[index]
         return ""
     
-    def min_cash_flow_recursion(self, amount):
-        max_credit = self.get_maximum_index(amount)
-        max_debit = self.get_minimum_index(amount)
-        
-        # Base case: if both credits and debits are negligible
-        if amount[max_credit] <= 0.01 and amount[max_debit] >= -0.01:
-            return
-        
-        # Calculate minimum transfer amount
-        minimum = self.minimum_of_two(-amount[max_debit], amount[max_credit])
-        amount[max_credit] -= minimum
-        amount[max_debit] += minimum
-        
-        debtor_name = self.find_name_for_index(max_debit)
-        creditor_name = self.find_name_for_index(max_credit)
-        
-        print(f"{debtor_name} pays {minimum:.2f} to {creditor_name}.")
-        
-        # Recursive call
-        self.min_cash_flow_recursion(amount)
+    # records that debtor owes amount more to creditor (a negative amount reverses it)
+    def add_debt(self, debtor, creditor, amount):
+        self.net[creditor] += amount
+        self.net[debtor] -= amount
     
-    def min_cash_flow(self):
-        # Calculate net amount for each person
-        amount = [0.0 for _ in range(self.number_of_persons)]
-        
-        for p in range(self.number_of_persons):
-            for i in range(self.number_of_persons):
-                # amount[p] += what others owe to p - what p owes to others
-                amount[p] += (self.graph[i][p] - self.graph[p][i])
-        
-        self.min_cash_flow_recursion(amount)
+    # adds (sign=1) or reverses (sign=-1) the debts created by an expense
+    def apply_expense(self, exp, sign):
+        each_person_expense = exp.amount / len(exp.participants)
+        for participant in exp.participants:
+            self.add_debt(self.people_dict[participant], self.people_dict[exp.payer], sign * each_person_expense)
     
-    def settle(self):
+    # adds (sign=1) or reverses (sign=-1) the effect of a transfer
+    def apply_transfer(self, transfer, sign):
+        # transferred_to owes less to person_who_transferred
+        self.add_debt(self.people_dict[transfer.to_person], self.people_dict[transfer.from_person], sign * transfer.amount)
+    
+    def min_cash_flow(self, optimal=False):
+        settlement = optimal_settlement if optimal else greedy_settlement
+        for debtor, creditor, minimum in settlement(self.net):
+            debtor_name = self.find_name_for_index(debtor)
+            creditor_name = self.find_name_for_index(creditor)
+            print(f"{debtor_name} pays {minimum:.2f} to {creditor_name}.")
+    
+    def settle(self, optimal=False):
         self.line(64)
         print("\n")
-        self.min_cash_flow()
+        self.min_cash_flow(optimal)
         print("\n")
         self.line(64)
         print("\n")
@@ -114,13 +229,12 @@ class Group:
             except ValueError:
                 print("Invalid input. Please enter a valid number.")
         
-        # Update graph: transferred_to owes less to person_who_transferred
-        self.graph[self.people_dict[transferred_to]][self.people_dict[person_who_transferred]] += transfer_money
-        
-        # Record transfer
+        # Record transfer and update net amounts
         transfer = Transfer(person_who_transferred, transferred_to, transfer_money)
+        self.apply_transfer(transfer, 1)
         self.transfer_history.append(transfer)
         print("Transfer recorded successfully!")
+        return transfer
     
     def add_expense(self):
         print(f"Enter expense amount to group {self.group_name}: ", end="")
@@ -164,17 +278,12 @@ class Group:
                 return
             participants.append(person)
         
-        # Calculate each person's share
-        each_person_expense = expense / n
-        
-        # Update graph: each participant owes their share to the payer
-        for participant in participants:
-            self.graph[self.people_dict[participant]][self.people_dict[person_who_paid]] += each_person_expense
-        
-        # Record expense
+        # Record expense; each participant owes their share to the payer
         new_expense = Expense(person_who_paid, category, expense, participants)
+        self.apply_expense(new_expense, 1)
         self.expense_history.append(new_expense)
         print("Expense added successfully!")
+        return new_expense
     
     def generate_report(self):
         print(f"\n********** Expense Report and Transfer History for Group {self.group_name} **********\n")
@@ -220,11 +329,16 @@ class Group:
                 print("Invalid input. Please enter a valid number: ", end="")
         
         exp = self.expense_history[index - 1]
+        # Take the old expense out of the balances; the edited one is added back below
+        self.apply_expense(exp, -1)
         print(f"Editing Expense {index}:")
         print(f"  Current Payer: {exp.payer}")
         new_payer = input("  Enter new payer (or press Enter to keep the same): ")
         if new_payer.strip():
-            exp.payer = new_payer.strip()
+            if new_payer.strip() in self.people_dict:
+                exp.payer = new_payer.strip()
+            else:
+                print("Person not found in the group. Keeping original payer.")
         
         print(f"  Current Category: {exp.category}")
         new_category = input("  Enter new category (or press Enter to keep the same): ")
@@ -242,9 +356,15 @@ class Group:
         print(f"  Current Participants: {' '.join(exp.participants)}")
         new_participants_str = input("  Enter new participants separated by space (or press Enter to keep the same): ")
         if new_participants_str.strip():
-            exp.participants = new_participants_str.strip().split()
+            new_participants = new_participants_str.strip().split()
+            if all(person in self.people_dict for person in new_participants):
+                exp.participants = new_participants
+            else:
+                print("Person not found in the group. Keeping original participants.")
         
+        self.apply_expense(exp, 1)
         print("Expense updated successfully!")
+        return exp
     
     def delete_expense(self):
         if not self.expense_history:
@@ -263,8 +383,10 @@ class Group:
             except ValueError:
                 print("Invalid input. Please enter a valid number: ", end="")
         
-        del self.expense_history[index - 1]
+        exp = self.expense_history.pop(index - 1)
+        self.apply_expense(exp, -1)
         print("Expense deleted successfully!")
+        return exp
     
     def edit_transfer(self):
         if not self.transfer_history:
@@ -284,16 +406,24 @@ class Group:
                 print("Invalid input. Please enter a valid number: ", end="")
         
         transfer = self.transfer_history[index - 1]
+        # Take the old transfer out of the balances; the edited one is added back below
+        self.apply_transfer(transfer, -1)
         print(f"Editing Transfer {index}:")
         print(f"  Current Sender: {transfer.from_person}")
         new_sender = input("  Enter new sender (or press Enter to keep the same): ")
         if new_sender.strip():
-            transfer.from_person = new_sender.strip()
+            if new_sender.strip() in self.people_dict:
+                transfer.from_person = new_sender.strip()
+            else:
+                print("Person not found in the group. Keeping original sender.")
         
         print(f"  Current Receiver: {transfer.to_person}")
         new_receiver = input("  Enter new receiver (or press Enter to keep the same): ")
         if new_receiver.strip():
-            transfer.to_person = new_receiver.strip()
+            if new_receiver.strip() in self.people_dict:
+                transfer.to_person = new_receiver.strip()
+            else:
+                print("Person not found in the group. Keeping original receiver.")
         
         print(f"  Current Amount: {transfer.amount}")
         new_amount_str = input("  Enter new amount (or press Enter to keep the same): ")
@@ -303,7 +433,9 @@ class Group:
             except ValueError:
                 print("Invalid amount. Keeping original amount.")
         
+        self.apply_transfer(transfer, 1)
         print("Transfer updated successfully!")
+        return transfer
     
     def delete_transfer(self):
         if not self.transfer_history:
@@ -322,11 +454,359 @@ class Group:
             except ValueError:
                 print("Invalid input. Please enter a valid number: ", end="")
         
-        del self.transfer_history[index - 1]
+        transfer = self.transfer_history.pop(index - 1)
+        self.apply_transfer(transfer, -1)
         print("Transfer deleted successfully!")
+        return transfer
+
+# BULK LEDGER IMPORT
+# Whole ledgers can be settled without the menu. A ledger file has one row per
+# expense or transfer with the columns type,from,to,amount:
+#   expense,<payer>,<participant;participant;...>,<amount>
+#   transfer,<sender>,<receiver>,<amount>
+# as CSV (with or without that header), a JSON array of objects with the same
+# keys, or JSON lines (.jsonl); in JSON "to" may also be a list of names.
+# Only the net amount per person is accumulated: an expense credits the payer
+# the full amount and debits each participant an equal share, exactly as the
+# expense's debts do in Group.net; a transfer credits the sender and debits the receiver.
+
+# Function to read ledger records as (row number, type, from, [to...], amount)
+def iter_ledger_records(path):
+    if path.endswith('.json') or path.endswith('.jsonl'):
+        with open(path) as ledger_file:
+            if path.endswith('.jsonl'):
+                records = (json.loads(line) for line in ledger_file if line.strip())
+            else:
+                records = json.load(ledger_file)
+            for row, record in enumerate(records, 1):
+                targets = record.get("to", [])
+                if isinstance(targets, str):
+                    targets = targets.split(';')
+                yield row, record.get("type", ""), record.get("from", ""), targets, record.get("amount", 0)
+        return
+    
+    with open(path, newline='') as ledger_file:
+        for row, fields in enumerate(csv.reader(ledger_file), 1):
+            if not fields or (row == 1 and fields[0].strip().lower() == "type"):
+                continue
+            if len(fields) < 4:
+                raise ValueError(f"{path}:{row}: expected type,from,to,amount")
+            yield row, fields[0], fields[1], fields[2].split(';'), fields[3]
+
+# Function to turn ledger records into batches of (credit people, credit amounts,
+# debit people, debit amounts); new names are added to people_dict as they appear
+def iter_ledger_batches(path, people_dict, batch_size):
+    credit_idx, credit_amt, debit_idx, debit_amt = [], [], [], []
+    for row, kind, source, targets, amount in iter_ledger_records(path):
+        kind = kind.strip().lower()
+        targets = [name.strip() for name in targets if name.strip()]
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            raise ValueError(f"{path}:{row}: invalid amount {amount!r}")
+        if kind not in ("expense", "transfer") or amount <= 0 or not targets:
+            raise ValueError(f"{path}:{row}: expected an expense or transfer with a positive amount")
+        if kind == "transfer" and len(targets) != 1:
+            raise ValueError(f"{path}:{row}: a transfer has exactly one receiver")
+        
+        names = [source.strip()] + targets
+        indexes = []
+        for name in names:
+            idx = people_dict.get(name)
+            if idx is None:
+                idx = people_dict[name] = len(people_dict)
+            indexes.append(idx)
+        
+        credit_idx.append(indexes[0])
+        credit_amt.append(amount)
+        share = amount / len(targets)
+        for idx in indexes[1:]:
+            debit_idx.append(idx)
+            debit_amt.append(share)
+        
+        if len(credit_idx) == batch_size:
+            yield credit_idx, credit_amt, debit_idx, debit_amt
+            credit_idx, credit_amt, debit_idx, debit_amt = [], [], [], []
+    if credit_idx:
+        yield credit_idx, credit_amt, debit_idx, debit_amt
+
+# Function to accumulate net amounts per person from a ledger file
+def load_ledger_nets(path, people_dict=None, batch_size=1_000_000):
+    people_dict = {} if people_dict is None else people_dict
+    rows = 0
+    if np is not None:
+        net = np.zeros(len(people_dict))
+        for credit_idx, credit_amt, debit_idx, debit_amt in iter_ledger_batches(path, people_dict, batch_size):
+            size = len(people_dict)
+            if len(net) < size:
+                net = np.concatenate([net, np.zeros(size - len(net))])
+            net += np.bincount(credit_idx, weights=credit_amt, minlength=size)
+            net -= np.bincount(debit_idx, weights=debit_amt, minlength=size)
+            rows += len(credit_idx)
+        net = net.tolist()
+    else:
+        net = [0.0] * len(people_dict)
+        for credit_idx, credit_amt, debit_idx, debit_amt in iter_ledger_batches(path, people_dict, batch_size):
+            net.extend([0.0] * (len(people_dict) - len(net)))
+            for idx, amount in zip(credit_idx, credit_amt):
+                net[idx] += amount
+            for idx, amount in zip(debit_idx, debit_amt):
+                net[idx] -= amount
+            rows += len(credit_idx)
+    return people_dict, net, rows
+
+# Function to settle a ledger file and write the payments to output_path (or print them)
+def settle_ledger(path, output_path=None, optimal=False, batch_size=1_000_000):
+    start = time.perf_counter()
+    people_dict, net, rows = load_ledger_nets(path, batch_size=batch_size)
+    loaded = time.perf_counter() - start
+    
+    index_to_name = [""] * len(people_dict)
+    for name, idx in people_dict.items():
+        index_to_name[idx] = name
+    settlement = optimal_settlement if optimal else greedy_settlement
+    payments = settlement(net)
+    lines = [f"{index_to_name[debtor]} pays {minimum:.2f} to {index_to_name[creditor]}.\n"
+             for debtor, creditor, minimum in payments]
+    if output_path:
+        with open(output_path, 'w') as output_file:
+            output_file.writelines(lines)
+    else:
+        print("".join(lines), end="")
+    
+    elapsed = time.perf_counter() - start
+    rate = rows / loaded if loaded > 0 else float('inf')
+    print(f"Loaded {rows} row(s) for {len(people_dict)} people in {loaded:.2f}s ({rate:,.0f} rows/s); "
+          f"{len(payments)} payment(s), {elapsed:.2f}s total")
+    if output_path:
+        print(f"Settlement written to {output_path}")
+    return payments
+
+# PARALLEL SETTLEMENT OF MANY GROUPS
+# Workers only need each group's net vector, so a group travels as its name plus
+# the raw bytes of an array of doubles (8 bytes per person); names are resolved
+# back in the parent. Groups go out in chunks to amortize the pickling cost, and
+# only a few chunks per worker are in flight so results stream back steadily.
+
+# Worker: settle a chunk of (group name, packed net vector); returns (group name, payments)
+def settle_chunk(chunk, optimal=False):
+    settlement = optimal_settlement if optimal else greedy_settlement
+    results = []
+    for group_name, packed in chunk:
+        net = array('d')
+        net.frombytes(packed)
+        results.append((group_name, settlement(net)))
+    return results
+
+# Generator yielding (group, payments) for every group, settled on a process pool
+def iter_settlements(group_map, optimal=False, workers=None, chunk_size=1000):
+    workers = workers or os.cpu_count() or 1
+    items = iter(group_map.values())
+    
+    def next_chunk():
+        chunk = {}
+        for group in items:
+            chunk[group.group_name] = group
+            if len(chunk) == chunk_size:
+                break
+        return chunk
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}    # future -> the groups it settles (kept so they need no reloading)
+        while True:
+            while len(pending) < 4 * workers:
+                chunk = next_chunk()
+                if not chunk:
+                    break
+                packed = [(group_name, array('d', group.net).tobytes()) for group_name, group in chunk.items()]
+                pending[executor.submit(settle_chunk, packed, optimal)] = chunk
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                for group_name, payments in future.result():
+                    yield chunk[group_name], payments
+
+# Function to settle every group in parallel, writing payments to output_path (or printing them)
+def settle_all(group_map=None, output_path=None, optimal=False, workers=None, chunk_size=1000):
+    group_map = groups if group_map is None else group_map
+    start = time.perf_counter()
+    output = open(output_path, 'w') if output_path else sys.stdout
+    settled = 0
+    try:
+        for group, payments in iter_settlements(group_map, optimal, workers, chunk_size):
+            for debtor, creditor, minimum in payments:
+                output.write(f"{group.group_name}: {group.find_name_for_index(debtor)} pays {minimum:.2f} "
+                             f"to {group.find_name_for_index(creditor)}.\n")
+            settled += 1
+    finally:
+        if output_path:
+            output.close()
+    
+    elapsed = time.perf_counter() - start
+    rate = settled / elapsed if elapsed > 0 else float('inf')
+    print(f"Settled {settled} group(s) in {elapsed:.2f}s ({rate:,.0f} groups/s)")
+    return settled
+
+# PERSISTENT STORAGE
+# Groups are kept in SQLite (one row per group, expense and transfer) and loaded
+# lazily. GroupCache keeps only the most recently used groups in memory. Every
+# change writes only the row it touches: expenses and transfers keep a stable
+# row id, so adding is one INSERT and editing or deleting one UPDATE/DELETE by
+# id. Evicting a group never needs a write, and its debts are rebuilt from the
+# history on load.
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (name TEXT PRIMARY KEY, people TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS expenses (
+    id INTEGER PRIMARY KEY, group_name TEXT NOT NULL, payer TEXT NOT NULL, category TEXT NOT NULL,
+    amount REAL NOT NULL, participants TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS expenses_by_group ON expenses (group_name, id);
+CREATE TABLE IF NOT EXISTS transfers (
+    id INTEGER PRIMARY KEY, group_name TEXT NOT NULL, from_person TEXT NOT NULL, to_person TEXT NOT NULL,
+    amount REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS transfers_by_group ON transfers (group_name, id);
+"""
+
+# SQLite-backed group store
+class GroupStore:
+    def __init__(self, path=":memory:"):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(STORE_SCHEMA)
+    
+    def __contains__(self, group_name):
+        return self.conn.execute("SELECT 1 FROM groups WHERE name = ?", (group_name,)).fetchone() is not None
+    
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM groups").fetchone()[0]
+    
+    def names(self):
+        for (group_name,) in self.conn.execute("SELECT name FROM groups ORDER BY name"):
+            yield group_name
+    
+    # writes the group and any of its expenses/transfers not stored yet
+    def save(self, group):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO groups VALUES (?, ?)",
+                              (group.group_name, json.dumps(group.index_to_name)))
+            for exp in group.expense_history:
+                if exp.row_id is None:
+                    self.write_expense(group.group_name, exp)
+            for transfer in group.transfer_history:
+                if transfer.row_id is None:
+                    self.write_transfer(group.group_name, transfer)
+    
+    # inserts a new expense row or updates its existing one
+    def write_expense(self, group_name, exp):
+        fields = (exp.payer, exp.category, exp.amount, json.dumps(exp.participants))
+        if exp.row_id is None:
+            exp.row_id = self.conn.execute(
+                "INSERT INTO expenses (group_name, payer, category, amount, participants) VALUES (?, ?, ?, ?, ?)",
+                (group_name,) + fields).lastrowid
+        else:
+            self.conn.execute("UPDATE expenses SET payer = ?, category = ?, amount = ?, participants = ? WHERE id = ?",
+                              fields + (exp.row_id,))
+    
+    # inserts a new transfer row or updates its existing one
+    def write_transfer(self, group_name, transfer):
+        fields = (transfer.from_person, transfer.to_person, transfer.amount)
+        if transfer.row_id is None:
+            transfer.row_id = self.conn.execute(
+                "INSERT INTO transfers (group_name, from_person, to_person, amount) VALUES (?, ?, ?, ?)",
+                (group_name,) + fields).lastrowid
+        else:
+            self.conn.execute("UPDATE transfers SET from_person = ?, to_person = ?, amount = ? WHERE id = ?",
+                              fields + (transfer.row_id,))
+    
+    def save_expense(self, group_name, exp):
+        with self.conn:
+            self.write_expense(group_name, exp)
+    
+    def save_transfer(self, group_name, transfer):
+        with self.conn:
+            self.write_transfer(group_name, transfer)
+    
+    def delete_expense(self, exp):
+        with self.conn:
+            self.conn.execute("DELETE FROM expenses WHERE id = ?", (exp.row_id,))
+    
+    def delete_transfer(self, transfer):
+        with self.conn:
+            self.conn.execute("DELETE FROM transfers WHERE id = ?", (transfer.row_id,))
+    
+    def load(self, group_name):
+        row = self.conn.execute("SELECT people FROM groups WHERE name = ?", (group_name,)).fetchone()
+        if row is None:
+            return None
+        names = json.loads(row[0])
+        group = Group(group_name, len(names), {name: idx for idx, name in enumerate(names)})
+        for row_id, payer, category, amount, participants in self.conn.execute(
+                "SELECT id, payer, category, amount, participants FROM expenses WHERE group_name = ? ORDER BY id",
+                (group_name,)):
+            exp = Expense(payer, category, amount, json.loads(participants))
+            exp.row_id = row_id
+            group.apply_expense(exp, 1)
+            group.expense_history.append(exp)
+        for row_id, from_person, to_person, amount in self.conn.execute(
+                "SELECT id, from_person, to_person, amount FROM transfers WHERE group_name = ? ORDER BY id",
+                (group_name,)):
+            transfer = Transfer(from_person, to_person, amount)
+            transfer.row_id = row_id
+            group.apply_transfer(transfer, 1)
+            group.transfer_history.append(transfer)
+        return group
+    
+    def close(self):
+        self.conn.close()
 
-# Global dictionary to store all groups
-groups = {}
+# Dictionary-like view of a GroupStore with an LRU cache of loaded groups
+class GroupCache:
+    def __init__(self, store, capacity=10_000):
+        self.store = store
+        self.capacity = capacity        # Most groups held in memory at once
+        self.cache = OrderedDict()      # group name -> Group, least recently used first
+    
+    def __contains__(self, group_name):
+        return group_name in self.cache or group_name in self.store
+    
+    def __getitem__(self, group_name):
+        group = self.cache.get(group_name)
+        if group is not None:
+            self.cache.move_to_end(group_name)
+            return group
+        group = self.store.load(group_name)
+        if group is None:
+            raise KeyError(group_name)
+        self.remember(group)
+        return group
+    
+    def __setitem__(self, group_name, group):
+        self.store.save(group)
+        self.remember(group)
+    
+    def __len__(self):
+        return self.store.count()
+    
+    def __iter__(self):
+        return self.store.names()
+    
+    def keys(self):
+        return self.store.names()
+    
+    def values(self):
+        for group_name in list(self.store.names()):
+            yield self[group_name]
+    
+    def remember(self, group):
+        self.cache[group.group_name] = group
+        self.cache.move_to_end(group.group_name)
+        # Every change is already saved, so evicted groups are simply dropped
+        while len(self.cache) > self.capacity:
+            self.cache.popitem(last=False)
+
+# All groups by name: loaded lazily from the store, most recently used kept in memory
+groups = GroupCache(GroupStore())
 
 def display_menu(group_name):
     group = groups[group_name]
@@ -341,36 +821,51 @@ def display_menu(group_name):
         print(" 6. Delete an Expense")
         print(" 7. Edit a Transfer")
         print(" 8. Delete a Transfer")
-        print(" 9. Exit")
+        print(f" 9. Settle up {group_name} with the fewest payments")
+        print(" 10. Exit")
         print("-" * 64)
         
         while True:
             try:
                 option = int(input("Enter your option: "))
-                if option < 1 or option > 9:
-                    print("Please enter a number between 1 and 9: ", end="")
+                if option < 1 or option > 10:
+                    print("Please enter a number between 1 and 10: ", end="")
                     continue
                 break
             except ValueError:
-                print("Invalid input. Please enter a number between 1 and 9: ", end="")
+                print("Invalid input. Please enter a number between 1 and 10: ", end="")
         
         if option == 1:
-            group.add_expense()
+            expense = group.add_expense()
+            if expense is not None:
+                groups.store.save_expense(group_name, expense)
         elif option == 2:
-            group.transfer()
+            transfer = group.transfer()
+            if transfer is not None:
+                groups.store.save_transfer(group_name, transfer)
         elif option == 3:
             group.settle()
         elif option == 4:
             group.generate_report()
         elif option == 5:
-            group.edit_expense()
+            expense = group.edit_expense()
+            if expense is not None:
+                groups.store.save_expense(group_name, expense)
         elif option == 6:
-            group.delete_expense()
+            expense = group.delete_expense()
+            if expense is not None:
+                groups.store.delete_expense(expense)
         elif option == 7:
-            group.edit_transfer()
+            transfer = group.edit_transfer()
+            if transfer is not None:
+                groups.store.save_transfer(group_name, transfer)
         elif option == 8:
-            group.delete_transfer()
+            transfer = group.delete_transfer()
+            if transfer is not None:
+                groups.store.delete_transfer(transfer)
         elif option == 9:
+            group.settle(optimal=True)
+        elif option == 10:
             break
     
     print("\n\n\n")
@@ -412,7 +907,10 @@ def enter_old_group():
         return
     
     print("\nAvailable groups:")
-    for group_name in groups.keys():
+    for shown, group_name in enumerate(groups.keys()):
+        if shown == 20:
+            print(f"  ... and {len(groups) - 20} more")
+            break
         print(f"  - {group_name}")
     
     while True:
@@ -431,29 +929,56 @@ def initial_display_menu():
         print("-" * 64)
         print("\n1. Add a new group")
         print("2. Enter in old group")
-        print("3. Exit")
+        print("3. Settle up all groups")
+        print("4. Exit")
         print("-" * 64)
         
         while True:
             try:
                 choice = int(input("Enter your choice: "))
-                if choice < 1 or choice > 3:
-                    print("Please enter a number between 1 and 3: ", end="")
+                if choice < 1 or choice > 4:
+                    print("Please enter a number between 1 and 4: ", end="")
                     continue
                 break
             except ValueError:
-                print("Invalid input. Please enter a number between 1 and 3: ", end="")
+                print("Invalid input. Please enter a number between 1 and 4: ", end="")
         
         if choice == 1:
             form_new_group()
         elif choice == 2:
             enter_old_group()
         elif choice == 3:
+            if not groups:
+                print("\n\nNo groups formed. Form a new group first.\n")
+            else:
+                settle_all()
+        elif choice == 4:
             print("Thank you for using Splitter!")
             break
 
 def main():
-    initial_display_menu()
+    parser = argparse.ArgumentParser(description="Splitter: split expenses and settle up")
+    parser.add_argument("--ledger", help="settle a CSV/JSON expense and transfer file without the menu")
+    parser.add_argument("--output", help="write the settlement here instead of printing it")
+    parser.add_argument("--optimal", action="store_true", help="settle with the fewest payments")
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--db", help="keep groups in this SQLite file so they survive restarts")
+    parser.add_argument("--cache-size", type=int, default=10_000, help="most groups kept in memory")
+    args = parser.parse_args()
+    
+    if args.ledger:
+        try:
+            settle_ledger(args.ledger, args.output, args.optimal, args.batch_size)
+        except ValueError as e:
+            print(f"Could not import ledger: {e}")
+        return
+    
+    global groups
+    groups = GroupCache(GroupStore(args.db or ":memory:"), args.cache_size)
+    try:
+        initial_display_menu()
+    finally:
+        groups.store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
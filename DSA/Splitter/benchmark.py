@@ -0,0 +1,155 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from Splitter import (OPTIMAL_MAX_PEOPLE, Expense, Group, GroupCache, GroupStore, greedy_settlement,
+                      optimal_settlement, settle_all, settle_ledger)
+from splitter_kruskal import Edge, kruskal
+
+# Generate net balances in whole rupees that sum to zero
+def generate_balances(num_people, rng):
+    balances = [rng.randint(-500, 500) for _ in range(num_people - 1)]
+    balances.append(-sum(balances))
+    return balances
+
+# Compare payment counts and runtime of the greedy and the optimal settlement
+def bench_settlement(args):
+    rng = random.Random(args.seed)
+    print(f"{'people':>6} {'greedy payments':>16} {'optimal payments':>17} "
+          f"{'greedy ms':>10} {'optimal ms':>11}")
+    for num_people in args.people:
+        groups = [generate_balances(num_people, rng) for _ in range(args.groups)]
+        results = []
+        for settlement in (greedy_settlement, optimal_settlement):
+            payments = 0
+            start = time.perf_counter()
+            for balances in groups:
+                payments += len(settlement(balances))
+            elapsed = (time.perf_counter() - start) / args.groups
+            results.append((payments / args.groups, elapsed * 1e3))
+        (greedy_count, greedy_ms), (optimal_count, optimal_ms) = results
+        print(f"{num_people:6d} {greedy_count:16.2f} {optimal_count:17.2f} "
+              f"{greedy_ms:10.3f} {optimal_ms:11.3f}")
+    print(f"(groups above {OPTIMAL_MAX_PEOPLE} unmatched people fall back to the greedy)")
+
+# Time union-find Kruskal on a random sparse graph
+def bench_mst(args):
+    rng = random.Random(args.seed)
+    edges = [Edge(rng.randrange(args.nodes), rng.randrange(args.nodes), rng.random())
+             for _ in range(args.edges)]
+    start = time.perf_counter()
+    mst = kruskal(args.nodes, edges)
+    elapsed = time.perf_counter() - start
+    print(f"Kruskal: {args.edges} edges, {args.nodes} nodes -> {len(mst)} tree edges "
+          f"in {elapsed:.2f}s ({args.edges / elapsed:,.0f} edges/s)")
+
+# Write a random CSV ledger and time the bulk import and settlement
+def bench_ledger(args):
+    rng = random.Random(args.seed)
+    names = [f"person{i}" for i in range(args.people)]
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_path = os.path.join(tmp, 'ledger.csv')
+        print(f"Writing {args.rows} ledger rows for {args.people} people...")
+        with open(ledger_path, 'w') as ledger_file:
+            ledger_file.write("type,from,to,amount\n")
+            for _ in range(args.rows):
+                if rng.random() < 0.8:
+                    participants = ";".join(rng.sample(names, rng.randint(1, 4)))
+                    ledger_file.write(f"expense,{rng.choice(names)},{participants},{rng.randint(1, 5000)}\n")
+                else:
+                    ledger_file.write(f"transfer,{rng.choice(names)},{rng.choice(names)},{rng.randint(1, 2000)}\n")
+        settle_ledger(ledger_path, os.path.join(tmp, 'settlement.txt'), batch_size=args.batch_size)
+
+# Build many random groups and time settle_all as the worker count grows
+def bench_groups(args):
+    rng = random.Random(args.seed)
+    print(f"Building {args.groups} groups of {args.people} people...")
+    group_map = {}
+    for g in range(args.groups):
+        group = Group(f"group{g}", args.people, {f"person{i}": i for i in range(args.people)})
+        for _ in range(args.debts):
+            group.add_debt(rng.randrange(args.people), rng.randrange(args.people), rng.randint(1, 500))
+        group_map[group.group_name] = group
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in args.workers:
+            print(f"{workers} worker(s): ", end="", flush=True)
+            settle_all(group_map, os.path.join(tmp, 'settlement.txt'), workers=workers,
+                       chunk_size=args.chunk_size)
+
+# Save many groups to SQLite, then time random lazy lookups through the LRU cache
+def bench_store(args):
+    rng = random.Random(args.seed)
+    names = [f"person{i}" for i in range(args.people)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = GroupStore(os.path.join(tmp, 'splitter.db'))
+        start = time.perf_counter()
+        for g in range(args.groups):
+            group = Group(f"group{g}", args.people, {name: i for i, name in enumerate(names)})
+            for _ in range(args.expenses):
+                expense = Expense(rng.choice(names), "food", rng.randint(1, 500), rng.sample(names, 3))
+                group.apply_expense(expense, 1)
+                group.expense_history.append(expense)
+            store.save(group)
+        elapsed = time.perf_counter() - start
+        print(f"Saved {args.groups} groups in {elapsed:.2f}s ({args.groups / elapsed:,.0f} groups/s)")
+
+        cache = GroupCache(store, args.cache_size)
+        hot = max(1, args.groups // 100)
+        start = time.perf_counter()
+        for _ in range(args.lookups):
+            # Most lookups go to a small hot set, the way active groups do
+            g = rng.randrange(hot) if rng.random() < 0.9 else rng.randrange(args.groups)
+            cache[f"group{g}"]
+        elapsed = time.perf_counter() - start
+        print(f"{args.lookups} lookups in {elapsed:.2f}s ({args.lookups / elapsed:,.0f} lookups/s), "
+              f"{len(cache.cache)} of {len(cache)} groups in memory")
+        store.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Splitter benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    settlement = subparsers.add_parser("settlement", help="greedy vs optimal settlement")
+    settlement.add_argument("--people", type=int, nargs="+", default=[4, 8, 12, 16, 32])
+    settlement.add_argument("--groups", type=int, default=50, help="random groups per size")
+    settlement.add_argument("--seed", type=int, default=0)
+    settlement.set_defaults(func=bench_settlement)
+
+    mst = subparsers.add_parser("mst", help="union-find Kruskal on a random graph")
+    mst.add_argument("--nodes", type=int, default=100_000)
+    mst.add_argument("--edges", type=int, default=1_000_000)
+    mst.add_argument("--seed", type=int, default=0)
+    mst.set_defaults(func=bench_mst)
+
+    ledger = subparsers.add_parser("ledger", help="bulk ledger import and settlement throughput")
+    ledger.add_argument("--rows", type=int, default=10_000_000)
+    ledger.add_argument("--people", type=int, default=1000)
+    ledger.add_argument("--batch-size", type=int, default=1_000_000)
+    ledger.add_argument("--seed", type=int, default=0)
+    ledger.set_defaults(func=bench_ledger)
+
+    many = subparsers.add_parser("groups", help="parallel settlement of many groups")
+    many.add_argument("--groups", type=int, default=200_000)
+    many.add_argument("--people", type=int, default=8)
+    many.add_argument("--debts", type=int, default=10, help="random debts per group")
+    many.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    many.add_argument("--chunk-size", type=int, default=1000)
+    many.add_argument("--seed", type=int, default=0)
+    many.set_defaults(func=bench_groups)
+
+    store = subparsers.add_parser("store", help="SQLite group store with lazy LRU loading")
+    store.add_argument("--groups", type=int, default=20_000)
+    store.add_argument("--people", type=int, default=6)
+    store.add_argument("--expenses", type=int, default=5, help="expenses per group")
+    store.add_argument("--lookups", type=int, default=200_000)
+    store.add_argument("--cache-size", type=int, default=10_000)
+    store.add_argument("--seed", type=int, default=0)
+    store.set_defaults(func=bench_store)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import math
-from typing import List, Dict, Optional
+from operator import attrgetter
+from typing import Iterable, List, Dict, Optional
 
 class Expense:
     def __init__(self, payer: str = "", category: str = "", amount: float = 0.0, participants: Optional[List[str]] = None):
@@ -20,6 +21,46 @@ class Edge:
         self.to_node = to_node
         self.weight = weight
 
+# Union-find with union by rank and path compression (near O(1) per operation)
+class DisjointSet:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+    
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point everything on the way straight at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+    
+    # Merges the sets of a and b; returns False if they were already one set
+    def union(self, a: int, b: int) -> bool:
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return True
+
+# Minimum spanning forest of any edge source, O(E log E) for the sort
+def kruskal(num_nodes: int, edges: Iterable[Edge]) -> List[Edge]:
+    mst = []
+    components = DisjointSet(num_nodes)
+    for edge in sorted(edges, key=attrgetter("weight")):
+        if components.union(edge.from_node, edge.to_node):
+            mst.append(edge)
+            if len(mst) == num_nodes - 1:
+                break
+    return mst
+
 def line(n: int) -> None:
     print("-" * n)
 
@@ -29,7 +70,8 @@ class Group:
         self.number_of_persons = num_people
         self.people_arr = people_dict
         self.people_included_in_expense_arr: Dict[str, int] = {}
-        self.graph = [[0.0 for _ in range(num_people)] for _ in range(num_people)]
+        # Sparse debt graph: graph[debtor][creditor] = amount owed
+        self.graph: Dict[int, Dict[int, float]] = {}
         self.expense_history: List[Expense] = []
         self.transfer_history: List[Transfer] = []
     
@@ -71,12 +113,17 @@ class Group:
         
         self.min_cash_flow_recursion(amount)
     
+    def add_debt(self, debtor: int, creditor: int, amount: float) -> None:
+        creditors = self.graph.setdefault(debtor, {})
+        creditors[creditor] = creditors.get(creditor, 0.0) + amount
+    
     def min_cash_flow(self) -> None:
         amount = [0.0] * self.number_of_persons
         
-        for p in range(self.number_of_persons):
-            for i in range(self.number_of_persons):
-                amount[p] += (self.graph[i][p] - self.graph[p][i])
+        for debtor, creditors in self.graph.items():
+            for creditor, owed in creditors.items():
+                amount[creditor] += owed
+                amount[debtor] -= owed
         
         self.min_cash_flow_recursion(amount)
     
@@ -109,7 +156,7 @@ class Group:
             print("Invalid input. Please enter a positive number.")
             return
         
-        self.graph[self.people_arr[transferred_to]][self.people_arr[person_who_transferred]] += transfer_money
+        self.add_debt(self.people_arr[transferred_to], self.people_arr[person_who_transferred], transfer_money)
         
         transfer = Transfer(person_who_transferred, transferred_to, transfer_money)
         self.transfer_history.append(transfer)
@@ -150,7 +197,7 @@ class Group:
         each_person_expense = expense / n
         
         for participant in participants:
-            self.graph[self.people_arr[participant]][self.people_arr[person_who_paid]] += each_person_expense
+            self.add_debt(self.people_arr[participant], self.people_arr[person_who_paid], each_person_expense)
         
         new_expense = Expense(person_who_paid, category, expense, participants)
         self.expense_history.append(new_expense)
@@ -274,33 +321,16 @@ class Group:
         self.transfer_history.pop(index - 1)
     
     def get_edges(self) -> List[Edge]:
+        # Only the stored debts are visited, never the full V x V matrix
         edges = []
-        for i in range(self.number_of_persons):
-            for j in range(i + 1, self.number_of_persons):
-                if self.graph[i][j] != 0:
-                    e = Edge(i, j, self.graph[i][j])
-                    edges.append(e)
+        for i, creditors in self.graph.items():
+            for j, weight in creditors.items():
+                if i < j and weight != 0:
+                    edges.append(Edge(i, j, weight))
         return edges
     
     def minimum_spanning_tree(self) -> List[Edge]:
-        edges = self.get_edges()
-        edges.sort(key=lambda x: x.weight)
-        
-        mst = []
-        tree_id = list(range(self.number_of_persons))
-        
-        for edge in edges:
-            a = edge.from_node
-            b = edge.to_node
-            w = edge.weight
-            if tree_id[a] != tree_id[b]:
-                mst.append(edge)
-                old_id = tree_id[b]
-                new_id = tree_id[a]
-                for i in range(self.number_of_persons):
-                    if tree_id[i] == old_id:
-                        tree_id[i] = new_id
-        return mst
+        return kruskal(self.number_of_persons, self.get_edges())
 
 # Dictionary to store groups
 groups: Dict[str, Group] = {}